@@ -294,6 +294,8 @@ class HardwareConfig:
 	led_pin: int = 17
 	button_bounce_time: float = 0.02
 	led_brightness: float = 1.0
+	audio_cpu: Optional[int] = None  # Pin the audio callback thread to this CPU (Linux), None = no pinning
+	audio_rt_priority: Optional[int] = None  # SCHED_FIFO priority (1-99) for the audio callback thread (Linux), None = normal scheduling
 
 # Alias for backward compatibility
 GPIOConfig = HardwareConfig
@@ -394,6 +396,8 @@ class OpulentVoiceConfig:
 				'led_pin': self.gpio.led_pin,
 				'button_bounce_time': self.gpio.button_bounce_time,
 				'led_brightness': self.gpio.led_brightness,
+				'audio_cpu': self.gpio.audio_cpu,
+				'audio_rt_priority': self.gpio.audio_rt_priority,
 			},
 		}
 
@@ -465,6 +469,8 @@ class OpulentVoiceConfig:
 			config.gpio.led_pin = hw_data.get('led_pin', config.gpio.led_pin)
 			config.gpio.button_bounce_time = hw_data.get('button_bounce_time', config.gpio.button_bounce_time)
 			config.gpio.led_brightness = hw_data.get('led_brightness', config.gpio.led_brightness)
+			config.gpio.audio_cpu = hw_data.get('audio_cpu', config.gpio.audio_cpu)
+			config.gpio.audio_rt_priority = hw_data.get('audio_rt_priority', config.gpio.audio_rt_priority)
 		# v1.x fallback: gpio section
 		elif 'gpio' in data:
 			gpio_data = data['gpio']
@@ -637,6 +643,10 @@ class ConfigurationManager:
 			self.config.gpio.ptt_pin = args.ptt_pin
 		if hasattr(args, 'led_pin') and args.led_pin is not None:
 			self.config.gpio.led_pin = args.led_pin
+		if hasattr(args, 'audio_cpu') and args.audio_cpu is not None:
+			self.config.gpio.audio_cpu = args.audio_cpu
+		if hasattr(args, 'audio_rt_priority') and args.audio_rt_priority is not None:
+			self.config.gpio.audio_rt_priority = args.audio_rt_priority
 
 		# Debug settings
 		if hasattr(args, 'verbose') and args.verbose:
@@ -697,6 +707,10 @@ class ConfigurationManager:
 			self.config.gpio.ptt_pin = args.ptt_pin
 		if hasattr(args, 'led_pin') and args.led_pin is not None:
 			self.config.gpio.led_pin = args.led_pin
+		if hasattr(args, 'audio_cpu') and args.audio_cpu is not None:
+			self.config.gpio.audio_cpu = args.audio_cpu
+		if hasattr(args, 'audio_rt_priority') and args.audio_rt_priority is not None:
+			self.config.gpio.audio_rt_priority = args.audio_rt_priority
 		
 		# Debug settings
 		if hasattr(args, 'verbose') and args.verbose:
@@ -834,6 +848,8 @@ hardware:
   # Advanced settings (edit manually if needed):
   button_bounce_time: 0.02        # Button debounce time (seconds)
   led_brightness: 1.0             # LED brightness (0.0 - 1.0)
+  audio_cpu: null                 # CPU core for the audio thread (Linux only, null = no pinning)
+  audio_rt_priority: null         # SCHED_FIFO priority 1-99 for the audio thread (Linux, needs root or CAP_SYS_NICE)
 
 # =============================================================================
 # CONFIGURATION METADATA
@@ -889,6 +905,12 @@ description: "Opulent Voice Protocol Configuration"
 		if self.config.gpio.ptt_pin == self.config.gpio.led_pin:
 			errors.append("PTT pin and LED pin cannot be the same")
 		
+		if self.config.gpio.audio_cpu is not None and self.config.gpio.audio_cpu < 0:
+			errors.append(f"Invalid audio CPU: {self.config.gpio.audio_cpu}")
+		
+		if self.config.gpio.audio_rt_priority is not None and not (1 <= self.config.gpio.audio_rt_priority <= 99):
+			errors.append(f"Invalid audio real-time priority: {self.config.gpio.audio_rt_priority}")
+		
 		# Validate target type
 		if self.config.protocol.target_type not in ["computer", "modem"]:
 			errors.append(f"Invalid target_type: {self.config.protocol.target_type}. Must be 'computer' or 'modem'")
@@ -1263,6 +1285,16 @@ Configuration:
 		action='store_true',
 		help='Interactive audio device setup and exit'
 	)
+	audio_group.add_argument(
+		'--audio-cpu',
+		type=int,
+		help='Pin the audio callback thread to this CPU core (Linux only)'
+	)
+	audio_group.add_argument(
+		'--audio-rt-priority',
+		type=int,
+		help='Run the audio callback thread as SCHED_FIFO at this priority, 1-99 (Linux, needs root or CAP_SYS_NICE)'
+	)
 	
 	# Protocol settings
 	protocol_group = parser.add_argument_group('Protocol Settings')
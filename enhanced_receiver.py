@@ -6,8 +6,8 @@ Enhanced MessageReceiver with Web Interface Integration
 import asyncio
 import threading
 import time
-import struct
 import json
+import selectors
 import socket
 import pyaudio
 import logging
@@ -20,6 +20,8 @@ from radio_protocol import (
     COBSFrameBoundaryManager, 
     OpulentVoiceProtocolWithIP,
     StationIdentifier,
+    UDPHeader,
+    BatchedDatagramReceiver,
     DebugConfig
 )
 
@@ -185,6 +187,10 @@ class EnhancedMessageReceiver:
         self.socket = None
         self.running = False
         self.receive_thread = None
+        self.process_thread = None
+        self.process_queue = Queue()
+        self.selector = None
+        self.wakeup_reader, self.wakeup_writer = None, None
         self._stopped = False
         self._audio_stopped = False
 
@@ -225,11 +231,20 @@ class EnhancedMessageReceiver:
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.bind(('', self.listen_port))
-            self.socket.settimeout(1.0)
+            self.socket.setblocking(False)
+            self.batch_receiver = BatchedDatagramReceiver(self.socket)
+
+            # stop() writes to the wakeup pair, so the loop sleeps until traffic or shutdown
+            self.wakeup_reader, self.wakeup_writer = socket.socketpair()
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.socket, selectors.EVENT_READ)
+            self.selector.register(self.wakeup_reader, selectors.EVENT_READ)
             
             self.running = True
             self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
             self.receive_thread.start()
+            self.process_thread = threading.Thread(target=self._process_loop, daemon=True)
+            self.process_thread.start()
             
             print(f"👂 Enhanced receiver listening on port {self.listen_port}")
             print("🌐 Web interface notifications enabled")
@@ -243,33 +258,47 @@ class EnhancedMessageReceiver:
             
         self._stopped = True
         self.running = False
+        if self.wakeup_writer:
+            self.wakeup_writer.send(b"\x00")
         
         if self.receive_thread:
             self.receive_thread.join(timeout=2.0)
-        if self.socket:
-            self.socket.close()
+        if self.process_thread:
+            self.process_queue.put(None)
+            self.process_thread.join(timeout=2.0)
+        if self.selector:
+            self.selector.close()
+        for sock in (self.socket, self.wakeup_reader, self.wakeup_writer):
+            if sock:
+                sock.close()
         print("👂 Enhanced receiver stopped")
         
     def _receive_loop(self):
         """Enhanced receive loop with web notifications"""
         while self.running:
             try:
-                data, addr = self.socket.recvfrom(4096)
-                self.stats['total_packets'] += 1
-                
-                # Process in separate thread to avoid blocking
-                threading.Thread(
-                    target=self._process_received_data_async,
-                    args=(data, addr),
-                    daemon=True
-                ).start()
-                
-            except socket.timeout:
-                continue
+                for key, _ in self.selector.select():
+                    if key.fileobj is not self.socket:
+                        continue
+
+                    for datagram in self.batch_receiver.receive():
+                        self.stats['total_packets'] += 1
+
+                        # Process on the worker thread to avoid blocking
+                        self.process_queue.put(datagram)
+
             except Exception as e:
                 if self.running:
                     print(f"Receive error: {e}")
 
+    def _process_loop(self):
+        """Process received datagrams in arrival order on one long-lived thread"""
+        while True:
+            datagram = self.process_queue.get()
+            if datagram is None:
+                break
+            self._process_received_data_async(*datagram)
+
 
 
 
@@ -281,21 +310,19 @@ class EnhancedMessageReceiver:
                 print(f"⚠ Expected 134-byte frame, got {len(data)}B from {addr}")
                 return
 
-            ov_header = data[:12]
-            fragment_payload = data[12:]
-
-            # Parse OV header
-            station_bytes, token, reserved = struct.unpack('>6s 3s 3s', ov_header)
+            # Parse OV header in place; the reassembler skips it by offset
+            station_bytes, token, reserved = OpulentVoiceProtocolWithIP.OV_HEADER.unpack_from(data)
 
             if token != OpulentVoiceProtocolWithIP.TOKEN:
                 return
             
             if station_bytes in self.block_list:
-                DebugConfig.debug_print(f"🚫 blocked frame from: {station_bytes.hex()}")
+                if DebugConfig.VERBOSE:
+                    DebugConfig.debug_print(f"🚫 blocked frame from: {station_bytes.hex()}")
                 return
 
             # Step 2: Try to reassemble COBS frames
-            cobs_frames = self.reassembler.add_frame_payload(fragment_payload)
+            cobs_frames = self.reassembler.add_frame_payload(data, 12)
 
             # Step 3: Process each complete COBS frame
             for i, frame in enumerate(cobs_frames):
@@ -337,7 +364,7 @@ class EnhancedMessageReceiver:
                 return
                 
             udp_payload = ip_frame[ip_header_length + 8:]
-            udp_dest_port = struct.unpack('!H', ip_frame[ip_header_length + 2:ip_header_length + 4])[0]
+            udp_dest_port = UDPHeader.HEADER_STRUCT.unpack_from(ip_frame, ip_header_length)[1]
             
             current_time = datetime.now().isoformat()
             
@@ -383,14 +410,11 @@ class EnhancedMessageReceiver:
                 print(f"🌐 Not enough data for UDP header")
                 return
 
-            # Extract UDP frame and payload
-            udp_frame = ip_frame[ip_header_length:]
+            # Extract UDP payload
             udp_payload = ip_frame[ip_header_length + 8:]  # Skip IP + UDP headers
         
-            # Parse UDP header to determine port/type
-            if len(udp_frame) >= 8:
-                udp_header = udp_frame[:8]
-                src_port, dst_port, udp_length, udp_checksum = struct.unpack('!HHHH', udp_header)
+            # Parse UDP header in place to determine port/type
+            src_port, dst_port, udp_length, udp_checksum = UDPHeader.HEADER_STRUCT.unpack_from(ip_frame, ip_header_length)
             
             # Check if the lengths match
             if udp_length - 8 != len(udp_payload):
@@ -886,8 +910,9 @@ class AudioOutputManager:
             self.playback_queue.put_nowait(audio_packet)
             self.stats['packets_queued'] += 1
             
-            DebugConfig.debug_print(f"🔊 Queued audio: {len(pcm_data)}B from {from_station} "
-                  f"(queue: {self.playback_queue.qsize()})")
+            if DebugConfig.VERBOSE:
+                DebugConfig.debug_print(f"🔊 Queued audio: {len(pcm_data)}B from {from_station} "
+                      f"(queue: {self.playback_queue.qsize()})")
             
         except Exception as e:
             self.stats['buffer_overruns'] += 1
@@ -914,8 +939,9 @@ class AudioOutputManager:
                     self.stats['packets_played'] += 1
                     self.stats['total_samples_played'] += audio_packet['sample_count']
                     
-                    print(f"🔊 Playing audio from {from_station}: "
-                          f"{len(pcm_data)}B ({audio_packet['sample_count']} samples)")
+                    if DebugConfig.VERBOSE:
+                        DebugConfig.debug_print(f"🔊 Playing audio from {from_station}: "
+                              f"{len(pcm_data)}B ({audio_packet['sample_count']} samples)")
                 
             except Empty:
                 # No audio to play - normal timeout
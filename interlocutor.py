@@ -12,7 +12,7 @@ GPIO PTT Audio, Terminal Chat, Control Messages, and Config Files
 - Audio transcription
 - Specialized command dictionary (dice roller, etc)
 
-Text Input → ChatManagerAudioDriven → AudioDrivenFrameManager.queue_text_message() → Simple Queue()
+Text Input → ChatManagerAudioDriven → AudioDrivenFrameManager.queue_text_message() → deque (drained by the audio callback)
 Voice Input → audio_callback → AudioDrivenFrameManager.process_voice_and_transmit() → Direct transmission
 
 Class Organization
@@ -20,6 +20,7 @@ Class Organization
 1. Foundation & Configuration "What do we need?"
 
 StreamFrame - Data container for the 40ms frame system
+AudioStats - Voice counters updated by the audio callback
 
 2. Chat & User Interface Layer "How do users interact with chat?"
 
@@ -76,7 +77,6 @@ def cleanup(self)       # Final cleanup
 
 import sys
 import socket
-import struct
 import time
 import threading
 import argparse
@@ -84,14 +84,19 @@ import re
 from datetime import datetime
 import asyncio
 from queue import PriorityQueue, Empty, Queue
+from collections import deque
 #from queue import Empty, Queue
 from enum import Enum
 from typing import Union, Tuple, Optional, List, Dict
 import select
+import selectors
 import logging
 import traceback
-import random
+import gc
+import os
+import ctypes
 import sounddevice
+import numpy as np
 from dataclasses import dataclass
 
 from config_manager import (
@@ -138,6 +143,7 @@ from radio_protocol import (
 	FrameType,
 	FramePriority,
 	NetworkTransmitter,
+	BatchedDatagramReceiver,
 	DebugConfig
 )
 
@@ -148,6 +154,9 @@ from interlocutor_commands import dispatcher as command_dispatcher
 # global variable for GUI
 web_interface_instance = None
 
+# PCM frames are checked for silence 64 bits at a time
+PCM_SILENCE_CHECK_DTYPE = np.dtype(np.uint64)
+
 # check for virtual environment
 if not (hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)):
 	print("You need to run this code in a virtual environment:")
@@ -180,7 +189,17 @@ except ImportError:
 # 1. FOUNDATION & CONFIGURATION
 # ===================================================================
 
+@dataclass(slots=True)
+class AudioStats:
+	"""Voice counters bumped from the audio callback every 40ms
 
+	Slotted fields instead of a dict, so each update is a plain
+	attribute store rather than a hashed key lookup.
+	"""
+	frames_encoded: int = 0
+	frames_sent: int = 0
+	encoding_errors: int = 0
+	invalid_frames: int = 0
 
 
 # ===================================================================
@@ -199,7 +218,10 @@ class TerminalChatInterface:
 	def start(self):
 		"""Start the chat interface in a separate thread"""
 		self.running = True
-		self.input_thread = threading.Thread(target=self._input_loop, daemon=True)
+		# stop() writes to this pipe to wake the input thread out of select();
+		# the thread closes the read end when it exits, stop() the write end
+		self._wakeup_r, self._wakeup_w = os.pipe()
+		self.input_thread = threading.Thread(target=self._input_loop, args=(self._wakeup_r,), daemon=True)
 		self.input_thread.start()
 		
 		print("\n" + "="*60)
@@ -215,7 +237,15 @@ class TerminalChatInterface:
 		"""Stop the chat interface"""
 		self.running = False
 		if self.input_thread:
+			try:
+				os.write(self._wakeup_w, b"\x00")
+			except OSError:
+				pass
 			self.input_thread.join(timeout=1.0)
+			# Safe even if the thread is still running: it only holds the read
+			# end, which reports EOF once this end is gone
+			os.close(self._wakeup_w)
+			self.input_thread = None
 	
 	def _show_prompt(self):
 		"""Show the chat prompt with status"""
@@ -229,69 +259,93 @@ class TerminalChatInterface:
 		
 		print(prompt, end='', flush=True)
 	
-	def _input_loop(self):
-		"""Input loop with smart buffering"""
-		while self.running:
-			try:
-				# Use select for non-blocking input on Unix systems
-				if select.select([sys.stdin], [], [], 0.1)[0]:
-					message = sys.stdin.readline().strip()
-					
-					if message.lower() == 'quit':
-						print("\nExiting chat interface...")
-						self.running = False
+	def _input_loop(self, wakeup_r):
+		"""
+		Input loop with smart buffering
+		Sleeps in select() until stdin has data (or stop() wakes it), then reads
+		whatever the terminal has with os.read and handles complete lines only.
+		"""
+		try:
+			# Raises for a stdin with no real file descriptor (StringIO, some services)
+			stdin_fd = sys.stdin.fileno()
+			pending = bytearray()
+
+			while self.running:
+				ready = select.select([stdin_fd, wakeup_r], [], [])[0]
+				if wakeup_r in ready:
+					break
+
+				chunk = os.read(stdin_fd, 4096)
+				if not chunk:
+					break  # stdin closed, nothing more to read
+
+				pending += chunk
+				while self.running:
+					newline = pending.find(b"\n")
+					if newline < 0:
 						break
-					
-					if message.lower() == 'status':
-						self._show_status()
-						self._show_prompt()
-						continue
-					
-					if message.lower() == 'clear':
-						cleared = self.chat_manager.clear_pending()
-						if cleared > 0:
-							print(f"🗑️  Cleared {cleared} buffered messages")
-						else:
-							print("🗑️  No buffered messages to clear")
-						self._show_prompt()
-						continue
-
-					if message.lower() == '/help' or message.lower() == 'help':
-						print("\nAvailable commands:")
-						for name, help_text in command_dispatcher.list_commands():
-							print(f"  {help_text}")
-						print("  status — Show chat statistics")
-						print("  clear  — Clear buffered messages")
-						print("  quit   — Exit chat interface")
-						print()
-						self._show_prompt()
-						continue
-					
-					if message:
-						# Check for slash-commands first
-						cmd_result = command_dispatcher.dispatch(message)
-						if cmd_result is not None:
-							# Command recognized — display locally, don't transmit
-							if cmd_result.is_error:
-								print(f"  ⚠️  {cmd_result.error}")
-							else:
-								print(f"  {cmd_result.summary}")
-						else:
-							# Normal chat — send through radio pipeline
-							result = self.chat_manager.handle_message_input(message)
-							self._display_result(result)
-					
-					# Show prompt again
-					self._show_prompt()
-				
-				time.sleep(0.1)  # Small delay to prevent busy waiting
-				
-			except Exception as e:
-				print(f"Chat input error: {e}")
-				break
+					line = pending[:newline].decode('utf-8', errors='replace')
+					del pending[:newline + 1]
+					self._handle_line(line.strip())
+
+		except Exception as e:
+			print(f"Chat input error: {e}")
+		finally:
+			os.close(wakeup_r)
+
+	def _handle_line(self, message):
+		"""Handle one line typed at the chat prompt"""
+		if message.lower() == 'quit':
+			print("\nExiting chat interface...")
+			self.running = False
+			return
+		
+		if message.lower() == 'status':
+			self._show_status()
+			self._show_prompt()
+			return
+		
+		if message.lower() == 'clear':
+			cleared = self.chat_manager.clear_pending()
+			if cleared > 0:
+				print(f"🗑️  Cleared {cleared} buffered messages")
+			else:
+				print("🗑️  No buffered messages to clear")
+			self._show_prompt()
+			return
+
+		if message.lower() == '/help' or message.lower() == 'help':
+			print("\nAvailable commands:")
+			for name, help_text in command_dispatcher.list_commands():
+				print(f"  {help_text}")
+			print("  status — Show chat statistics")
+			print("  clear  — Clear buffered messages")
+			print("  quit   — Exit chat interface")
+			print()
+			self._show_prompt()
+			return
+		
+		if message:
+			# Check for slash-commands first
+			cmd_result = command_dispatcher.dispatch(message)
+			if cmd_result is not None:
+				# Command recognized — display locally, don't transmit
+				if cmd_result.is_error:
+					print(f"  ⚠️  {cmd_result.error}")
+				else:
+					print(f"  {cmd_result.summary}")
+			else:
+				# Normal chat — send through radio pipeline
+				result = self.chat_manager.handle_message_input(message)
+				self._display_result(result)
+		
+		# Show prompt again
+		self._show_prompt()
 	
 	def _display_result(self, result):
 		"""Display result of message input"""
+		if DebugConfig.QUIET:
+			return
 		if result['status'] == 'sent':
 			DebugConfig.user_print(f"💬 Sent: {result['message']}")
 		elif result['status'] == 'buffered':
@@ -302,6 +356,8 @@ class TerminalChatInterface:
 	
 	def _show_status(self):
 		"""Show chat status"""
+		if DebugConfig.QUIET:
+			return
 		pending = self.chat_manager.get_pending_count()
 		ptt_status = "ACTIVE" if self.chat_manager.ptt_active else "INACTIVE"
 		
@@ -310,12 +366,13 @@ class TerminalChatInterface:
 		DebugConfig.user_print(f"   Buffered messages: {pending}")
 		if pending > 0:
 			DebugConfig.user_print(f"   📝 Pending messages:")
-			for i, msg in enumerate(self.chat_manager.pending_messages, 1):
+			for i, msg in enumerate(list(self.chat_manager.pending_messages), 1):
 				DebugConfig.user_print(f"	  {i}. {msg}")
 	
 	def display_received_message(self, from_station, message):
 		"""Display received chat message"""
-		DebugConfig.user_print(f"\n📨 [{from_station}]: {message}")
+		if not DebugConfig.QUIET:
+			DebugConfig.user_print(f"\n📨 [{from_station}]: {message}")
 		self._show_prompt()
 
 
@@ -328,7 +385,7 @@ class ChatManagerAudioDriven:
 		self.station_id = station_id
 		self.audio_frame_manager = audio_frame_manager  # Instead of frame_transmitter
 		self.ptt_active = False
-		self.pending_messages = []
+		self.pending_messages = deque()  # typed during PTT, drained oldest first on release
 		self.tts_manager = None # Set when TTS is initialized
 		self.web_interface_active = False  # Set to True when web interface is handling TTS
 	
@@ -382,8 +439,11 @@ class ChatManagerAudioDriven:
 		if not self.pending_messages:
 			return []
 		
+		# Pop rather than iterate and clear, so a message typed while
+		# flushing is sent too instead of being cleared unsent
 		sent_messages = []
-		for message in self.pending_messages:
+		while self.pending_messages:
+			message = self.pending_messages.popleft()
 			self.queue_message_for_transmission(message)
 			sent_messages.append(message)
 		
@@ -393,7 +453,6 @@ class ChatManagerAudioDriven:
 		else:
 			print(f"💬 Queued {len(sent_messages)} buffered messages for audio-driven transmission")
 		
-		self.pending_messages.clear()
 		return sent_messages
 	
 	def get_pending_count(self):
@@ -413,19 +472,28 @@ class ChatManagerAudioDriven:
 
 class AudioDrivenFrameManager:
 	'''Handles all frame logic within audio callback timing'''
+
+	# Keepalive control payload prefix, already encoded
+	KEEPALIVE_PREFIX = b"KEEPALIVE:"
+
 	def __init__(self, station_identifier, protocol, network_transmitter, config):
 		self.station_id = station_identifier
 		self.protocol = protocol
 		self.network_transmitter = network_transmitter
 		self.config = config
 		
-		# Frame queues
-		self.control_queue = Queue()
-		self.text_queue = Queue()
+		# Packet queues - deques, so the audio callback never waits on a lock
+		# (append/popleft are atomic; one producer thread, one consumer callback).
+		# They hold COBS packets, which are packed together into each 40ms slot.
+		self.control_queue = deque()
+		self.text_queue = deque()
+
+		# Remaining OV frames of a packet too big for one slot, with its type
+		self.pending_fragments = deque()
 		
-		# Voice state (no buffer needed)
+		# Voice state (no buffer needed - voice frames go straight out,
+		# so this single flag is the only voice state the scheduler reads)
 		self.voice_active = False
-		self.pending_voice_frame = None
 		
 		# Non-voice transmission throttling
 		self.frames_since_nonvoice = 0
@@ -449,6 +517,9 @@ class AudioDrivenFrameManager:
 			'voice_frames_sent': 0,
 			'control_frames_sent': 0,
 			'text_frames_sent': 0,
+			'coalesced_frames_sent': 0,  # frames carrying both control and text, counted under each
+			'control_messages_sent': 0,
+			'text_messages_sent': 0,
 			'keepalive_frames_sent': 0,
 			'skipped_frames': 0,
 			'last_frame_type': None,
@@ -457,30 +528,23 @@ class AudioDrivenFrameManager:
 
 	def process_voice_and_transmit(self, opus_packet, current_time):
 		"""
-		PAUL'S APPROACH: Process voice - may generate multiple frames per opus packet
+		PAUL'S APPROACH: Process voice - one OV frame per opus packet
 		"""
 		try:
-			# NEW: Create potentially multiple OV frames (Paul's approach)
-			ov_frames = self.protocol.create_audio_frames(opus_packet, is_start_of_transmission=False)
+			# create_audio_frames raises rather than split audio, so this is always one frame
+			ov_frame = self.protocol.create_audio_frames(opus_packet, is_start_of_transmission=False)[0]
 
-			frames_sent = 0
-			for frame in ov_frames:
-				success = self.network_transmitter.send_frame(frame)
-				if success:
-					frames_sent += 1
-					self.stats['voice_frames_sent'] += 1
-					self.stats['total_frames_sent'] += 1
-
-			if frames_sent > 0:
+			success = self.network_transmitter.send_frame(ov_frame)
+			if success:
+				self.stats['voice_frames_sent'] += 1
+				self.stats['total_frames_sent'] += 1
 				self.stats['last_frame_type'] = 'VOICE'
 				self.frames_since_nonvoice += 1
 				
-				if len(ov_frames) > 1:
-					DebugConfig.debug_print(f"📡 {current_time:.3f}: VOICE {frames_sent}/{len(ov_frames)} frames")
-				else:
-					DebugConfig.debug_print(f"📡 {current_time:.3f}: VOICE ({len(ov_frames[0])}B)")
+				if DebugConfig.VERBOSE:
+					DebugConfig.debug_print(f"📡 {current_time:.3f}: VOICE ({len(ov_frame)}B)")
 
-			return frames_sent > 0
+			return success
 
 		except Exception as e:
 			DebugConfig.debug_print(f"✗ Voice frame transmission error: {e}")
@@ -494,41 +558,31 @@ class AudioDrivenFrameManager:
 		"""
 		frames_sent_this_cycle = 0
 		
-		# Priority 1: Control messages (always send immediately)
-		try:
-			ov_frame = self.control_queue.get_nowait()
-			success = self.network_transmitter.send_frame(ov_frame)
-			if success:
-				frames_sent_this_cycle += 1
-				self.stats['control_frames_sent'] += 1
-				self.stats['total_frames_sent'] += 1
-				self.stats['last_frame_type'] = 'CONTROL'
-				self.frames_since_nonvoice = 0
-				DebugConfig.debug_print(f"📡 {current_time:.3f}: CONTROL ({len(ov_frame)}B)")
-				return True
-				
-		except Empty:
-			pass
-		except Exception as e:
-			DebugConfig.debug_print(f"✗ Control frame error: {e}")
-	
-		# Priority 2: Text messages (send every 40ms now - no throttling)
+		# Priority 1 and 2: Control, then text messages, coalesced into this slot
 		try:
-			ov_frame = self.text_queue.get_nowait()
-			success = self.network_transmitter.send_frame(ov_frame)
-			if success:
-				frames_sent_this_cycle += 1
-				self.stats['text_frames_sent'] += 1
-				self.stats['total_frames_sent'] += 1
-				self.stats['last_frame_type'] = 'TEXT'
-				self.frames_since_nonvoice = 0
-				DebugConfig.debug_print(f"📡 {current_time:.3f}: TEXT ({len(ov_frame)}B)")
-				return True
-			
-		except Empty:
-			pass
+			ov_frame, frame_type, control_count, text_count = self._next_message_frame()
+			if ov_frame is not None:
+				success = self.network_transmitter.send_frame(ov_frame)
+				if success:
+					frames_sent_this_cycle += 1
+					# A shared slot counts as a frame of each type it carries
+					if frame_type == 'CONTROL' or control_count:
+						self.stats['control_frames_sent'] += 1
+					if frame_type == 'TEXT' or text_count:
+						self.stats['text_frames_sent'] += 1
+					if control_count and text_count:
+						self.stats['coalesced_frames_sent'] += 1
+					self.stats['control_messages_sent'] += control_count
+					self.stats['text_messages_sent'] += text_count
+					self.stats['total_frames_sent'] += 1
+					self.stats['last_frame_type'] = frame_type
+					self.frames_since_nonvoice = 0
+					if DebugConfig.VERBOSE:
+						DebugConfig.debug_print(f"📡 {current_time:.3f}: {frame_type} ({len(ov_frame)}B, {control_count} control + {text_count} text message(s))")
+					return True
+
 		except Exception as e:
-			DebugConfig.debug_print(f"✗ Text frame error: {e}")
+			DebugConfig.debug_print(f"✗ Control/text frame error: {e}")
 	
 		# DEBUG: Show keepalive decision process (commented out because it's a lot of reporting)
 		time_since_keepalive = current_time - self.last_keepalive_time
@@ -538,7 +592,7 @@ class AudioDrivenFrameManager:
 		if self.send_keepalives and not self.voice_active:
 			if time_since_keepalive >= self.keepalive_interval:
 				try:
-					keepalive_data = f"KEEPALIVE:{int(current_time)}"
+					keepalive_data = b"%s%d" % (self.KEEPALIVE_PREFIX, int(current_time))
 					ov_frames = self.protocol.create_control_frames(keepalive_data)
 	
 					if ov_frames:
@@ -549,7 +603,8 @@ class AudioDrivenFrameManager:
 							self.stats['last_frame_type'] = 'KEEPALIVE'
 							self.last_keepalive_time = current_time
 							self.frames_since_nonvoice = 0
-							DebugConfig.debug_print(f"📡 {current_time:.3f}: KEEPALIVE ({len(ov_frames[0])}B) [computer target]")
+							if DebugConfig.VERBOSE:
+								DebugConfig.debug_print(f"📡 {current_time:.3f}: KEEPALIVE ({len(ov_frames[0])}B) [computer target]")
 							return True
 	
 				except Exception as e:
@@ -558,61 +613,79 @@ class AudioDrivenFrameManager:
 			# For modem targets: explicitly show that we're NOT sending keepalives
 			if time_since_keepalive >= self.keepalive_interval:
 				self.last_keepalive_time = current_time  # Update timer but don't send
-				DebugConfig.debug_print(f"📻 {current_time:.3f}: Keepalive SKIPPED (target_type={self.target_type}, send_keepalives={self.send_keepalives})")
+				if DebugConfig.VERBOSE:
+					DebugConfig.debug_print(f"📻 {current_time:.3f}: Keepalive SKIPPED (target_type={self.target_type}, send_keepalives={self.send_keepalives})")
 	
 		# Nothing sent this cycle
 		self.stats['skipped_frames'] += 1
 		self.frames_since_nonvoice += 1
 		return False
 
+	def _next_message_frame(self):
+		"""
+		Build the next control/text OV frame for this slot
+		Packs as many whole queued packets as fit (control first, then text);
+		a packet too big for one frame goes out alone over consecutive slots.
+		Returns (ov_frame, frame_type, control_count, text_count), where the
+		counts are the messages that start in this frame; (None, None, 0, 0) if idle.
+		frame_type is the type of the first packet in the frame.
+		"""
+		if self.pending_fragments:
+			ov_frame, frame_type = self.pending_fragments.popleft()
+			return ov_frame, frame_type, 0, 0
+
+		packets = []
+		frame_type = None
+		counts = {'CONTROL': 0, 'TEXT': 0}
+		room = self.protocol.frame_splitter.payload_size
+
+		for queue, queue_type in ((self.control_queue, 'CONTROL'), (self.text_queue, 'TEXT')):
+			while queue and len(queue[0]) <= room:
+				packet = queue.popleft()
+				packets.append(packet)
+				room -= len(packet)
+				counts[queue_type] += 1
+				frame_type = frame_type or queue_type
+
+			if queue:
+				if not packets:
+					# Head packet needs several frames of its own
+					ov_frames = self.protocol.create_frames_from_packet(queue.popleft(), queue_type.lower())
+					self.pending_fragments.extend((frame, queue_type) for frame in ov_frames[1:])
+					return ov_frames[0], queue_type, int(queue_type == 'CONTROL'), int(queue_type == 'TEXT')
+				break  # Keep queue order; the rest goes in the next slot
+
+		if not packets:
+			return None, None, 0, 0
+		return self.protocol.create_coalesced_frames(packets)[0], frame_type, counts['CONTROL'], counts['TEXT']
+
 	# Interface methods (compatible with existing code)
 	def set_voice_active(self, active):
 		"""Called when PTT pressed/released"""
 		self.voice_active = active
-		if not active:
-			self.pending_voice_frame = None
 
 	def queue_text_message(self, text_data):
 		"""
-		PAUL'S APPROACH: Queue text message - creates complete OV frames
+		PAUL'S APPROACH: Queue text message - framed in the next free slot
+		str or bytes is fine, create_text_packet encodes str exactly once
 		"""
-		if isinstance(text_data, str):
-			text_data = text_data.encode('utf-8')
-
 		try:
-			# NEW: Create potentially multiple OV frames (Paul's approach)
-			ov_frames = self.protocol.create_text_frames(text_data)
-
-			# Queue all frames
-			for frame in ov_frames:
-				self.text_queue.put(frame)
-
-			if len(ov_frames) > 1:
-				DebugConfig.debug_print(f"📝 Text message created {len(ov_frames)} frames: {text_data.decode()[:50]}...")
-			else:
-				DebugConfig.debug_print(f"📝 Text message queued: {text_data.decode()[:50]}...")
+			self.text_queue.append(self.protocol.create_text_packet(text_data))
+			if DebugConfig.VERBOSE:
+				preview = text_data if isinstance(text_data, str) else text_data.decode('utf-8', 'replace')
+				DebugConfig.debug_print(f"📝 Text message queued: {preview[:50]}...")
 
 		except Exception as e:
 			DebugConfig.debug_print(f"✗ Error queuing text message: {e}")
 
 	def queue_control_message(self, control_data):
 		"""
-		PAUL'S APPROACH: Queue control message - creates complete OV frames
+		PAUL'S APPROACH: Queue control message - framed in the next free slot
+		str or bytes is fine, create_control_packet encodes str exactly once
 		"""
-		if isinstance(control_data, str):
-			control_data = control_data.encode('utf-8')
-
 		try:
-			# NEW: Create potentially multiple OV frames (Paul's approach)
-			ov_frames = self.protocol.create_control_frames(control_data)
-
-			# Queue all frames
-			for frame in ov_frames:
-				self.control_queue.put(frame)
-
-			if len(ov_frames) > 1:
-				DebugConfig.debug_print(f"📋 Control message created {len(ov_frames)} frames")
-			else:
+			self.control_queue.append(self.protocol.create_control_packet(control_data))
+			if DebugConfig.VERBOSE:
 				DebugConfig.debug_print(f"📋 Control message queued")
 
 		except Exception as e:
@@ -624,8 +697,9 @@ class AudioDrivenFrameManager:
 			'scheduler_stats': self.stats,
 			'queue_status': {
 				'voice_active': self.voice_active,
-				'control_queue': self.control_queue.qsize(),
-				'text_queue': self.text_queue.qsize(),
+				'control_queue': len(self.control_queue),
+				'text_queue': len(self.text_queue),
+				'pending_fragments': len(self.pending_fragments),
 				'frames_since_nonvoice': self.frames_since_nonvoice
 			},
 			'frame_info': {
@@ -633,7 +707,7 @@ class AudioDrivenFrameManager:
 				'header_size': 12,
 				'payload_size': 121
 			},
-			'running': self.voice_active or not (self.control_queue.empty() and self.text_queue.empty())
+			'running': self.voice_active or bool(self.control_queue or self.text_queue or self.pending_fragments)
 		}
 
 
@@ -649,6 +723,8 @@ class MessageReceiver:
 		self.socket = None
 		self.running = False
 		self.receive_thread = None
+		self.selector = None
+		self.wakeup_reader, self.wakeup_writer = None, None
 
 		# Simple frame reassembler (no fragmentation headers)
 		self.reassembler = SimpleFrameReassembler()
@@ -662,7 +738,14 @@ class MessageReceiver:
 		try:
 			self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 			self.socket.bind(('', self.listen_port))
-			self.socket.settimeout(1.0)  # Allow periodic checking of running flag
+			self.socket.setblocking(False)
+			self.batch_receiver = BatchedDatagramReceiver(self.socket)
+
+			# stop() writes to the wakeup pair, so the loop sleeps until traffic or shutdown
+			self.wakeup_reader, self.wakeup_writer = socket.socketpair()
+			self.selector = selectors.DefaultSelector()
+			self.selector.register(self.socket, selectors.EVENT_READ)
+			self.selector.register(self.wakeup_reader, selectors.EVENT_READ)
 
 			self.running = True
 			self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
@@ -674,23 +757,37 @@ class MessageReceiver:
 			print(f"✗ Failed to start receiver: {e}")
 
 	def stop(self):
-		"""Stop the message receiver"""
+		"""Stop the message receiver, safe to call more than once"""
 		self.running = False
+		if self.wakeup_writer:
+			try:
+				self.wakeup_writer.send(b"\x00")
+			except OSError:
+				pass  # receive loop already gone, nothing to wake
 		if self.receive_thread:
 			self.receive_thread.join(timeout=2.0)
-		if self.socket:
-			self.socket.close()
+			self.receive_thread = None
+		if self.selector:
+			self.selector.close()
+			self.selector = None
+		for sock in (self.socket, self.wakeup_reader, self.wakeup_writer):
+			if sock:
+				sock.close()
+		self.socket = None
+		self.wakeup_reader, self.wakeup_writer = None, None
 		print("👂 Message receiver stopped")
 
 	def _receive_loop(self):
 		"""Main receive loop"""
 		while self.running:
 			try:
-				data, addr = self.socket.recvfrom(4096)
-				self._process_received_data(data, addr)
+				for key, _ in self.selector.select():
+					if key.fileobj is not self.socket:
+						continue  # Wakeup from stop(), check running flag
+
+					for data, addr in self.batch_receiver.receive():
+						self._process_received_data(data, addr)
 
-			except socket.timeout:
-				continue  # Normal timeout, check running flag
 			except Exception as e:
 				if self.running:  # Only log errors if we're supposed to be running
 					print(f"Receive error: {e}")
@@ -704,21 +801,19 @@ class MessageReceiver:
 			if len(data) < 12:
 				return
 
-			ov_header = data[:12]
-			fragment_payload = data[12:]
-
-			# Parse OV header
-			station_bytes, token, reserved = struct.unpack('>6s 3s 3s', ov_header)
+			# Parse OV header in place; the reassembler skips it by offset
+			station_bytes, token, reserved = OpulentVoiceProtocolWithIP.OV_HEADER.unpack_from(data)
 
 			if token != OpulentVoiceProtocolWithIP.TOKEN:
 				return  # Invalid frame
 
 			# Step 2: Try to reassemble COBS frames
-			cobs_frames = self.reassembler.add_frame_payload(fragment_payload)
+			cobs_frames = self.reassembler.add_frame_payload(data, 12)
 
 			# Step 3: Process all the reassembled COBS frames
 			for frame in cobs_frames:
-				DebugConfig.debug_print(f"📥 Received COBS frame from {addr}: {len(frame)}B")
+				if DebugConfig.VERBOSE:
+					DebugConfig.debug_print(f"📥 Received COBS frame from {addr}: {len(frame)}B")
 
 				# Step 4: COBS decode to get original IP frame
 				try:
@@ -755,11 +850,12 @@ class MessageReceiver:
 			udp_payload = ip_frame[ip_header_length + 8:]  # Skip IP + UDP headers
 
 			# Parse UDP header to determine port/type
-			udp_dest_port = struct.unpack('!H', ip_frame[ip_header_length + 2:ip_header_length + 4])[0]
+			udp_dest_port = UDPHeader.HEADER_STRUCT.unpack_from(ip_frame, ip_header_length)[1]
 
 			# Route based on UDP port
 			if udp_dest_port == 57373:  # Voice
-				DebugConfig.debug_print(f"🎤 [{from_station}] Voice: {len(udp_payload)}B")
+				if DebugConfig.VERBOSE:
+					DebugConfig.debug_print(f"🎤 [{from_station}] Voice: {len(udp_payload)}B")
 			elif udp_dest_port == 57374:  # Text  
 				try:
 					message = udp_payload.decode('utf-8')
@@ -830,6 +926,8 @@ class GPIOZeroPTTHandler:
 			self.encoder.bitrate = self.bitrate
 			# Set CBR mode
 			self.encoder.vbr = 0
+			# Output buffer reused by _encode_opus() for every frame
+			self.opus_output_buffer = ctypes.create_string_buffer(self.bytes_per_frame)
 			DebugConfig.debug_print(f"✓ OPUS encoder ready: {self.bitrate}bps CBR")
 		except Exception as e:
 			DebugConfig.system_print(f"✗ OPUS encoder error: {e}")
@@ -853,14 +951,10 @@ class GPIOZeroPTTHandler:
 		# Rest of existing initialization...
 		self.audio = pyaudio.PyAudio()
 		self.audio_input_stream = None
+		self.audio_thread_pinned = False  # set by the first audio callback
 
 		# Statistics
-		self.audio_stats = {
-			'frames_encoded': 0,
-			'frames_sent': 0,
-			'encoding_errors': 0,
-			'invalid_frames': 0
-		}
+		self.audio_stats = AudioStats()
 
 		# Chat interface - now uses ChatManager
 		self.chat_interface = TerminalChatInterface(self.station_id, self.chat_manager)
@@ -1088,12 +1182,15 @@ class GPIOZeroPTTHandler:
 	def validate_audio_frame(self, audio_data):
 		"""Validate audio data before encoding"""
 		if len(audio_data) != self.bytes_per_frame:
-			DebugConfig.debug_print(f"⚠ Invalid frame size: {len(audio_data)} (expected {self.bytes_per_frame})")
+			if DebugConfig.VERBOSE:
+				DebugConfig.debug_print(f"⚠ Invalid frame size: {len(audio_data)} (expected {self.bytes_per_frame})")
 			return False
 
 		# Check for all-zero frames (might indicate audio issues)
-		if audio_data == b'\x00' * len(audio_data):
-			DebugConfig.debug_print("⚠ All-zero audio frame detected")
+		# OR-reduce the frame in place rather than building a zero frame to compare against
+		if not np.frombuffer(audio_data, dtype=PCM_SILENCE_CHECK_DTYPE).any():
+			if DebugConfig.VERBOSE:
+				DebugConfig.debug_print("⚠ All-zero audio frame detected")
 			return False
 
 		return True
@@ -1114,29 +1211,76 @@ class GPIOZeroPTTHandler:
 
 
 
+	def _pin_audio_thread(self):
+		"""
+		Pin the calling PortAudio callback thread to config.gpio.audio_cpu and,
+		if config.gpio.audio_rt_priority is set, make it SCHED_FIFO at that priority.
+		Keeps the OPUS encoder state warm in one core's cache and stops ordinary
+		tasks from preempting the 40ms frame. Linux only; real-time scheduling
+		needs root or CAP_SYS_NICE.
+		"""
+		self.audio_thread_pinned = True
+		cpu = self.config.gpio.audio_cpu
+		if cpu is not None and hasattr(os, 'sched_setaffinity'):
+			try:
+				os.sched_setaffinity(0, {cpu})  # 0 = calling thread on Linux
+				DebugConfig.debug_print(f"📌 Audio thread pinned to CPU {cpu}")
+			except OSError as e:
+				DebugConfig.debug_print(f"⚠ Could not pin audio thread to CPU {cpu}: {e}")
+
+		priority = self.config.gpio.audio_rt_priority
+		if priority is not None and hasattr(os, 'sched_setscheduler'):
+			try:
+				os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+				DebugConfig.debug_print(f"📌 Audio thread running SCHED_FIFO at priority {priority}")
+			except OSError as e:
+				DebugConfig.debug_print(f"⚠ Could not set SCHED_FIFO priority {priority} for audio thread: {e}")
+
+	def _encode_opus(self, pcm_data):
+		"""
+		Encode one PCM frame to OPUS using our reusable output buffer
+
+		Same result as self.encoder.encode(), which allocates a fresh
+		frame-sized output buffer and copies the packet out of it twice.
+		"""
+		result = opuslib.api.encoder.libopus_encode(
+			self.encoder.encoder_state,
+			ctypes.cast(pcm_data, opuslib.api.c_int16_pointer),
+			self.samples_per_frame,
+			self.opus_output_buffer,
+			len(self.opus_output_buffer)
+		)
+		if result < 0:
+			raise opuslib.OpusError(result)
+		return ctypes.string_at(self.opus_output_buffer, result)
+
 	def audio_callback(self, in_data, frame_count, time_info, status):
 		"""
 		MODIFIED audio callback that drives all transmission
 		"""
-		if status:
+		if status and DebugConfig.VERBOSE:
 			DebugConfig.debug_print(f"⚠ Audio status flags: {status}")
 
+		if not self.audio_thread_pinned:
+			self._pin_audio_thread()
+
 		current_time = time.time()
 
 		# PART 1: Process incoming audio (existing logic)
 		if self.ptt_active:
 			if not self.validate_audio_frame(in_data):
-				self.audio_stats['invalid_frames'] += 1
+				self.audio_stats.invalid_frames += 1
 				return (None, pyaudio.paContinue)
 
 			try:
 				# Encode audio (existing logic)
-				opus_packet = self.encoder.encode(in_data, self.samples_per_frame)
-				self.audio_stats['frames_encoded'] += 1
+				opus_packet = self._encode_opus(in_data)
+				self.audio_stats.frames_encoded += 1
 
-				# Validate packet (existing logic)
-				if not self.validate_opus_packet(opus_packet):
-					self.audio_stats['invalid_frames'] += 1
+				# Validate packet (existing logic) - verbose runs only; in CBR mode the
+				# size is fixed, and the RTP frame builder rejects a bad one anyway
+				if DebugConfig.VERBOSE and not self.validate_opus_packet(opus_packet):
+					self.audio_stats.invalid_frames += 1
 					DebugConfig.debug_print(f"⚠ Dropping invalid OPUS packet")
 					return (None, pyaudio.paContinue)
 
@@ -1146,14 +1290,16 @@ class GPIOZeroPTTHandler:
 
 				# Send voice frame immediately using audio timing
 				if self.audio_frame_manager.process_voice_and_transmit(opus_packet, current_time):
-					self.audio_stats['frames_sent'] += 1
+					self.audio_stats.frames_sent += 1
 
 			except ValueError as e:
-				self.audio_stats['encoding_errors'] += 1
-				DebugConfig.debug_print(f"✗ Protocol violation: {e}")
+				self.audio_stats.encoding_errors += 1
+				if DebugConfig.VERBOSE:
+					DebugConfig.debug_print(f"✗ Protocol violation: {e}")
 			except Exception as e:
-				self.audio_stats['encoding_errors'] += 1
-				DebugConfig.debug_print(f"✗ Encoding error: {e}")
+				self.audio_stats.encoding_errors += 1
+				if DebugConfig.VERBOSE:
+					DebugConfig.debug_print(f"✗ Encoding error: {e}")
 
 		else:
 			# PART 2: No voice - use this 40ms slot for other traffic
@@ -1282,12 +1428,10 @@ class GPIOZeroPTTHandler:
 		# Create and send the control frame directly, bypassing the queue
 		try:
 			control_frames = self.protocol.create_control_frames(b"PTT_START")
-			for frame in control_frames:
-				success = self.transmitter.send_frame(frame)
-				if success:
-					DebugConfig.user_print(f"📡 PTT_START control frame sent immediately")
-				else:
-					DebugConfig.debug_print(f"✗ Failed to send immediate PTT_START")
+			if self.transmitter.send_frames(control_frames) == len(control_frames):
+				DebugConfig.user_print(f"📡 PTT_START control frame sent immediately")
+			else:
+				DebugConfig.debug_print(f"✗ Failed to send immediate PTT_START")
 		except Exception as e:
 			DebugConfig.debug_print(f"✗ Error sending PTT_START control frame immediately: {e}")
     
@@ -1392,12 +1536,10 @@ class GPIOZeroPTTHandler:
 		# Create and send the control frame directly, bypassing the queue
 		try:
 			control_frames = self.protocol.create_control_frames(b"PTT_STOP")
-			for frame in control_frames:
-				success = self.transmitter.send_frame(frame)
-				if success:
-					DebugConfig.user_print(f"📡 PTT_STOP control frame was sent immediately")
-				else:
-					DebugConfig.debug_print(f"✗ Failed to send immediate PTT_STOP")
+			if self.transmitter.send_frames(control_frames) == len(control_frames):
+				DebugConfig.user_print(f"📡 PTT_STOP control frame was sent immediately")
+			else:
+				DebugConfig.debug_print(f"✗ Failed to send immediate PTT_STOP")
 		except Exception as e:
 			DebugConfig.debug_print(f"✗ Error sending immediate PTT_STOP: {e}")
 
@@ -1461,7 +1603,8 @@ class GPIOZeroPTTHandler:
 	
 					# Run in separate thread to avoid blocking audio callback
 					threading.Thread(target=notify_web, daemon=True).start()
-					DebugConfig.debug_print(f"📤 Captured outgoing audio: {len(opus_packet)}B OPUS → {len(audio_pcm)}B PCM")
+					if DebugConfig.VERBOSE:
+						DebugConfig.debug_print(f"📤 Captured outgoing audio: {len(opus_packet)}B OPUS → {len(audio_pcm)}B PCM")
 				else:
 					DebugConfig.debug_print(f"⚠️ OPUS decode failed for outgoing audio")
 			else:   
@@ -1482,6 +1625,12 @@ class GPIOZeroPTTHandler:
 
 	def start(self):
 		"""Start the continuous stream system"""
+		# Everything built so far lives for the whole session. Move it out
+		# of the collector's reach so GC passes that land on the PortAudio
+		# thread only walk objects created after startup.
+		gc.collect()
+		gc.freeze()
+
 		if self.audio_input_stream:
 			self.audio_input_stream.start_stream()
 
@@ -1521,7 +1670,7 @@ class GPIOZeroPTTHandler:
 		# Create something that looks like 80 bytes of Opus data
 		# Random data is worst case situation for COBS, and will result
 		# in two bytes of overhead. This will trigger a rare audio split. 
-		test_opus_payload = bytes(random.randint(0, 255) for _ in range(80))
+		test_opus_payload = os.urandom(80)
 		print(f"   📏 Test OPUS payload: {len(test_opus_payload)}B (protocol-compliant)")
 
 		try:
@@ -1611,15 +1760,15 @@ class GPIOZeroPTTHandler:
 		stream_stats = self.audio_frame_manager.get_transmission_stats()
 
 		print(f"\n📊 {self.station_id} Transmission Statistics:")
-		print(f"   Voice frames encoded: {audio_stats['frames_encoded']}")
-		print(f"   Voice frames sent: {audio_stats['frames_sent']}")
-		print(f"   Invalid frames: {audio_stats['invalid_frames']}")
+		print(f"   Voice frames encoded: {audio_stats.frames_encoded}")
+		print(f"   Voice frames sent: {audio_stats.frames_sent}")
+		print(f"   Invalid frames: {audio_stats.invalid_frames}")
 		print(f"   Total network packets: {net_stats['packets_sent']}")
 		print(f"   Total bytes sent: {net_stats['bytes_sent']}")
 		print(f"   Stream stats: {stream_stats['scheduler_stats']}")
 		print(f"   Queue status: {stream_stats['queue_status']}")
 		print(f"   Stream active: {stream_stats['running']}")
-		print(f"   Encoding errors: {audio_stats['encoding_errors']}")
+		print(f"   Encoding errors: {audio_stats.encoding_errors}")
 		print(f"   Network errors: {net_stats['errors']}")
 
 		# Protocol stats (if available)
@@ -1629,8 +1778,8 @@ class GPIOZeroPTTHandler:
 			print(f"   COBS overhead: {protocol_stats['cobs']['avg_overhead_per_frame']:.1f}B/frame")
 
 		# Audio success rate
-		if audio_stats['frames_encoded'] > 0:
-			voice_success_rate = (audio_stats['frames_sent'] / audio_stats['frames_encoded']) * 100
+		if audio_stats.frames_encoded > 0:
+			voice_success_rate = (audio_stats.frames_sent / audio_stats.frames_encoded) * 100
 			print(f"   Voice success rate: {voice_success_rate:.1f}%")
 
 	def stop(self):
@@ -2048,31 +2197,34 @@ if __name__ == "__main__":
 			# Simple timing loop that calls the existing 40ms processor
 			def chat_timing_loop():
 				"""40ms timing loop using existing frame_manager.process_nonvoice_and_transmit()"""
+				# No audio stream in chat-only mode, so there is no PortAudio
+				# callback to act as the clock. Sleep until each monotonic
+				# deadline instead of polling every millisecond.
 				running = True
-				next_frame_time = time.time()
 				frame_interval = 0.040  # 40ms - YOUR PROTOCOL REQUIREMENT
+				next_frame_time = time.monotonic()
 				
 				while running:
 					try:
-						current_time = time.time()
-						
-						if current_time >= next_frame_time:
-							# Use existing 40ms processor (no changes to core logic)
-							frame_manager.process_nonvoice_and_transmit(current_time)
-							next_frame_time += frame_interval
-							
-							# Prevent drift
-							if next_frame_time < current_time:
-								next_frame_time = current_time + frame_interval
+						delay = next_frame_time - time.monotonic()
+						if delay > 0:
+							time.sleep(delay)
+
+						# Use existing 40ms processor (no changes to core logic)
+						frame_manager.process_nonvoice_and_transmit(time.time())
+						next_frame_time += frame_interval
 						
-						time.sleep(0.001)  # 1ms sleep prevents busy waiting
+						# Prevent drift
+						now = time.monotonic()
+						if next_frame_time < now:
+							next_frame_time = now + frame_interval
 						
 					except KeyboardInterrupt:
 						running = False
 						break
 					except Exception as e:
 						DebugConfig.debug_print(f"Chat timing error: {e}")
-						next_frame_time = time.time() + frame_interval
+						next_frame_time = time.monotonic() + frame_interval
 			
 			# Start components
 			receiver.start()
@@ -3,13 +3,18 @@
 Radio Protocol Classes for Interlocutor
 """
 
+import ctypes
+import errno
+import functools
 import logging
+import os
 import random
 import socket
 import struct
 import threading
 import time
-from enum import Enum
+import zlib
+from enum import Enum, IntEnum
 from typing import Dict, List, Tuple, Union
 
 
@@ -64,6 +69,19 @@ class DebugConfig:
 
 
 
+# Base-40 callsign alphabet, indexed by digit value (0 is not a character)
+BASE40_ALPHABET = " ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-/."
+
+# Byte value -> base-40 digit for encode_callsign, 0xFF marks an invalid character
+# (including the space, which is digit 0 and only ever implied by the encoding)
+BASE40_DIGITS = bytearray(b"\xff" * 256)
+for _digit, _char in enumerate(BASE40_ALPHABET[1:], start=1):
+	BASE40_DIGITS[ord(_char)] = _digit
+BASE40_DIGITS = bytes(BASE40_DIGITS)
+del _digit, _char
+
+
+@functools.lru_cache(maxsize=1024)
 def encode_callsign(callsign: str) -> int:
 	"""
 	Encodes a callsign into a 6-byte binary format using base-40 encoding.
@@ -74,22 +92,15 @@ def encode_callsign(callsign: str) -> int:
 	:param callsign: The callsign to encode.
 	:return: A 6-byte binary representation of the callsign.
 	"""
-	encoded = 0
+	digits = callsign.encode('latin-1', errors='replace').translate(BASE40_DIGITS)
+	if 0xFF in digits:
+		invalid = next(c for c in reversed(callsign) if c not in BASE40_ALPHABET[1:])
+		raise ValueError(f"Invalid character '{invalid}' in callsign.")
 
-	for c in callsign[::-1]:
-		encoded *= 40
-		if "A" <= c <= "Z":
-			encoded += ord(c) - ord("A") + 1
-		elif "0" <= c <= "9":
-			encoded += ord(c) - ord("0") + 27
-		elif c == "-":
-			encoded += 37
-		elif c == "/":
-			encoded += 38
-		elif c == ".":
-			encoded += 39
-		else:
-			raise ValueError(f"Invalid character '{c}' in callsign.")
+	# Horner's scheme, last character first
+	encoded = 0
+	for digit in reversed(digits):
+		encoded = encoded * 40 + digit
 
 	if encoded > 0xFFFFFFFFFFFF:
 		raise ValueError("Encoded callsign exceeds maximum length of 6 bytes.")
@@ -97,6 +108,7 @@ def encode_callsign(callsign: str) -> int:
 	return encoded
 
 
+@functools.lru_cache(maxsize=1024)
 def decode_callsign(encoded: int) -> str:
 	"""
 	Decodes a 6-byte binary callsign back to string format.
@@ -104,22 +116,14 @@ def decode_callsign(encoded: int) -> str:
 	:param encoded: The encoded callsign as an integer.
 	:return: The decoded callsign string.
 	"""
-	callsign_map = {
-		1: "A", 2: "B", 3: "C", 4: "D", 5: "E", 6: "F", 7: "G", 8: "H", 9: "I", 10: "J",
-		11: "K", 12: "L", 13: "M", 14: "N", 15: "O", 16: "P", 17: "Q", 18: "R", 19: "S", 20: "T",
-		21: "U", 22: "V", 23: "W", 24: "X", 25: "Y", 26: "Z", 27: "0", 28: "1", 29: "2", 30: "3",
-		31: "4", 32: "5", 33: "6", 34: "7", 35: "8", 36: "9", 37: "-", 38: "/", 39: ".",
-	}
-
-	decoded: str = ""
+	# Digits come out first character first, so no reversal is needed
+	decoded = []
 	while encoded > 0:
-		remainder = encoded % 40
-		if remainder in callsign_map:
-			decoded = callsign_map[remainder] + decoded
-		else:
+		encoded, remainder = divmod(encoded, 40)
+		if remainder == 0:
 			raise ValueError(f"Invalid encoded value: {remainder}")
-		encoded //= 40
-	return decoded[::-1]  # Reverse to get the correct order
+		decoded.append(BASE40_ALPHABET[remainder])
+	return "".join(decoded)
 
 
 class MessageType(Enum):
@@ -136,6 +140,11 @@ class MessageType(Enum):
 
 class StationIdentifier:
 	"""Domain model for flexible station identification using base-40 encoding"""
+
+	# Received frames repeat the same few station IDs, so from_bytes keeps
+	# the identifiers it has built (instances are never modified)
+	FROM_BYTES_CACHE_SIZE = 1024
+	_from_bytes_cache = {}
 	
 	def __init__(self, callsign):
 		"""Initialize with a flexible callsign (no SSID in base-40 encoding)"""
@@ -177,6 +186,11 @@ class StationIdentifier:
 	@classmethod
 	def from_bytes(cls, station_bytes):
 		"""Create StationIdentifier from 6-byte representation"""
+		key = bytes(station_bytes)
+		cached = cls._from_bytes_cache.get(key)
+		if cached is not None:
+			return cached
+
 		if len(station_bytes) != 6:
 			raise ValueError("Station ID must be exactly 6 bytes")
 		
@@ -186,9 +200,14 @@ class StationIdentifier:
 		# Decode the callsign
 		try:
 			callsign = decode_callsign(encoded_value)
-			return cls(callsign)
+			station = cls(callsign)
 		except ValueError as e:
 			raise ValueError(f"Failed to decode station ID: {e}")
+
+		if len(cls._from_bytes_cache) >= cls.FROM_BYTES_CACHE_SIZE:
+			cls._from_bytes_cache.clear()
+		cls._from_bytes_cache[key] = station
+		return station
 	
 	@classmethod
 	def from_encoded(cls, encoded_value):
@@ -221,50 +240,38 @@ class COBSEncoder:
 
 	MAX_BLOCK_SIZE = 254
 
+	# Single-byte COBS code values, so encode() never builds them per block
+	CODE_BYTES = tuple(bytes((code,)) for code in range(256))
+
 	@staticmethod
 	def encode(data: bytes) -> bytes:
 		"""Encode data using COBS algorithm
 		
 		This version of the COBS encoder returns the encoded data with the
 		COBS separator byte (0x00) included at the end.
-		"""
-		if not data:
-			return b'\x01\x00'	# 01 encodes the implied zero byte, followed by the separator byte
 
-		encoded = bytearray()
-		pos = 0
-
-		while pos < len(data):
-			# Find next zero byte (or end of data)
-			zero_pos = data.find(0, pos)
-			if zero_pos == -1:
-				zero_pos = len(data)  # No zero found, use end of data
-
-			block_len = zero_pos - pos
+		Splitting on zero bytes in one C-level call leaves only one short
+		Python step per block, and the output is joined once at the end.
+		"""
+		code_bytes = COBSEncoder.CODE_BYTES
+		max_block = COBSEncoder.MAX_BLOCK_SIZE
+		encoded = []
 
+		# Each zero byte ends a block; the data's end closes the last one
+		# (an empty block for empty data or a trailing zero)
+		for block in data.split(b'\x00'):
 			# Handle blocks larger than MAX_BLOCK_SIZE
-			while block_len >= COBSEncoder.MAX_BLOCK_SIZE:
-				encoded.append(COBSEncoder.MAX_BLOCK_SIZE + 1)  # 255
-				encoded.extend(data[pos:pos + COBSEncoder.MAX_BLOCK_SIZE])
-				pos += COBSEncoder.MAX_BLOCK_SIZE
-				block_len = zero_pos - pos
-
-			# Handle the remaining block (< MAX_BLOCK_SIZE)
-			if block_len > 0:
-				encoded.append(block_len + 1)
-				encoded.extend(data[pos:zero_pos])
-			else:
-				encoded.append(1)  # Zero-length block
-
-			pos = zero_pos + 1
+			while len(block) >= max_block:
+				encoded.append(code_bytes[max_block + 1])  # 255
+				encoded.append(block[:max_block])
+				block = block[max_block:]
 
-			# is this right?
-			if pos == len(data):
-				# If we reached the end, append the implied zero byte
-				encoded.append(1)
+			# Handle the remaining block (< MAX_BLOCK_SIZE, possibly empty)
+			encoded.append(code_bytes[len(block) + 1])
+			encoded.append(block)
 
-		encoded.append(0)  # COBS separator byte
-		return bytes(encoded)
+		encoded.append(b'\x00')  # COBS separator byte
+		return b"".join(encoded)
 
 
 	# FIXED COBS Decoder - Replace the decode method in radio_protocol.py
@@ -275,34 +282,39 @@ class COBSEncoder:
 		if not encoded_data or encoded_data[-1] != 0:
 			raise ValueError("COBS data must end with zero byte")
 
-		data = encoded_data[:-1]  # Remove separator byte
-		if data.find(b"\x00") != -1:
+		# Leave the separator byte out by length instead of copying the data
+		return COBSEncoder.decode_unterminated(encoded_data, len(encoded_data) - 1)
+
+	@staticmethod
+	def decode_unterminated(data: bytes, data_len: int = None) -> bytes:
+		"""Decode COBS data that has no separator byte, optionally only its first data_len bytes"""
+		if not isinstance(data, (bytes, bytearray)):
+			data = bytes(data)
+		if data_len is None:
+			data_len = len(data)
+
+		if data.find(b"\x00", 0, data_len) != -1:
 			raise ValueError("Unexpected zero byte in COBS data")
 		
-		decoded = bytearray()
+		decoded = []
 		pos = 0
 
-		while pos < len(data):
+		while pos < data_len:
 			code = data[pos]
-			pos += 1
+			block_end = pos + code
 
-			if code == 0:
-				raise ValueError("Unexpected zero byte in COBS data")
-
-			block_len = code - 1
-    
-			if pos + block_len > len(data):
+			if block_end > data_len:
 				raise ValueError("COBS block extends beyond data")
         
 			# Add the data block
-			decoded.extend(data[pos:pos + block_len])
-			pos += block_len
+			decoded.append(data[pos + 1:block_end])
+			pos = block_end
     
 			# FIXED: Add zero byte if this wasn't a max-length block AND we're not at the end
-			if code < 255 and pos < len(data):
-				decoded.append(0)
+			if code < 255 and pos < data_len:
+				decoded.append(b'\x00')
 
-		return bytes(decoded)
+		return b"".join(decoded)
 
 
 
@@ -370,24 +382,25 @@ class COBSFrameBoundaryManager:
 	def decode_frame(self, encoded_data: bytes) -> Tuple[bytes, int]:
 		"""Decode COBS frame and return original IP data - FIXED FOR 1-BYTE LOSS"""
 		try:
-			# Add terminator for decoding if needed
+			# Reassembled frames arrive without their terminator, so decode them
+			# as they are rather than copying them to append one
 			if encoded_data.endswith(b'\x00'):
-				cobs_data_with_terminator = encoded_data
+				decoded_frame = COBSEncoder.decode(encoded_data)
+				consumed = len(encoded_data)
 			else:
-				cobs_data_with_terminator = encoded_data + b'\x00'
-
-			# Decode the COBS data
-			decoded_frame = COBSEncoder.decode(cobs_data_with_terminator)
+				decoded_frame = COBSEncoder.decode_unterminated(encoded_data)
+				consumed = len(encoded_data) + 1
 
 			# Only show debug info in verbose mode
-			DebugConfig.debug_print(f"🔍 COBS decode: {len(encoded_data)}B → {len(decoded_frame)}B")
+			if DebugConfig.VERBOSE:
+				DebugConfig.debug_print(f"🔍 COBS decode: {len(encoded_data)}B → {len(decoded_frame)}B")
 
-			# Only show size mismatches (potential issues)
-			if len(decoded_frame) != 120:
-				DebugConfig.debug_print(f"⚠️ Unexpected frame size: {len(decoded_frame)}B (expected 120B)")
+				# Only show size mismatches (potential issues)
+				if len(decoded_frame) != 120:
+					DebugConfig.debug_print(f"⚠️ Unexpected frame size: {len(decoded_frame)}B (expected 120B)")
 
 			self.stats['frames_decoded'] += 1
-			return decoded_frame, len(cobs_data_with_terminator)
+			return decoded_frame, consumed
 
 		except Exception as e:
 			# Always show decode failures (they're important)
@@ -441,44 +454,76 @@ class SimpleFrameSplitter:
 	def split_cobs_frame(self, cobs_encoded_data: bytes, frame_type: str = "unknown") -> List[bytes]:
 		"""
 		ENHANCED: Split COBS frame with frame type tracking and split detection
+
+		LEGACY: the send paths use split_into_ov_frames now. Kept for callers
+		that want bare payload_size-byte payloads, the last one zero-padded.
 		"""
-		if len(cobs_encoded_data) <= self.payload_size:
-			# Single frame - pad to exactly payload_size bytes
-			padded_data = cobs_encoded_data + b'\x00' * (self.payload_size - len(cobs_encoded_data))
+		payload_size = self.payload_size
+		data_len = len(cobs_encoded_data)
+		frame_count = max(1, (data_len + payload_size - 1) // payload_size)
+
+		# Pad once up front so every slice is already full size
+		padded = bytes(cobs_encoded_data).ljust(frame_count * payload_size, b'\x00')
+		frames = [padded[i:i + payload_size] for i in range(0, len(padded), payload_size)]
+
+		self._count_frames(data_len, frame_count, frame_type)
+		return frames
+
+	def split_into_ov_frames(self, cobs_encoded_data: bytes, ov_header: bytes, frame_type: str = "unknown") -> List[bytes]:
+		"""
+		Split a COBS frame and prefix every piece with ov_header in one pass
+
+		Each whole frame is laid out directly, so no list of payloads is
+		built only to be joined onto headers afterwards.
+		"""
+		if len(ov_header) + self.payload_size != self.opulent_voice_frame_size:
+			raise ValueError(f"OV header must be {self.opulent_voice_frame_size - self.payload_size}B, got {len(ov_header)}B")
+
+		payload_size = self.payload_size
+		frame_size = self.opulent_voice_frame_size
+		data_len = len(cobs_encoded_data)
+
+		if data_len <= payload_size:
+			self._count_frames(data_len, 1, frame_type)
+			return [(ov_header + cobs_encoded_data).ljust(frame_size, b'\x00')]
+
+		frame_count = (data_len + payload_size - 1) // payload_size
+		frames = [None] * frame_count
+		data = memoryview(cobs_encoded_data)
+		padding = bytes(payload_size - (data_len - (frame_count - 1) * payload_size))
+		for k in range(frame_count):
+			start = k * payload_size
+			frames[k] = b"".join((ov_header, data[start:start + payload_size], padding if k == frame_count - 1 else b""))
+
+		self._count_frames(data_len, frame_count, frame_type)
+		return frames
+
+	def _count_frames(self, data_len, frame_count, frame_type):
+		"""Update split statistics for one COBS frame"""
+		self.stats['total_frames_created'] += frame_count
+
+		if frame_count == 1:
 			self.stats['single_frame_messages'] += 1
-			self.stats['total_frames_created'] += 1
-			#print(f"📦 {frame_type}: {len(cobs_encoded_data)}B COBS → 1 frame ({len(padded_data)}B) ✅")
-			return [padded_data]
+			#print(f"📦 {frame_type}: {data_len}B COBS → 1 frame ({self.payload_size}B) ✅")
+			return
         
 		# Multi-frame - this should NOT happen for audio!
 		if frame_type == "audio":
 			self.stats['audio_frames_split'] += 1
 			print(f"🚨 CRITICAL ERROR: Audio frame split!")
-			print(f"🚨 {len(cobs_encoded_data)}B COBS > {self.payload_size}B limit")
+			print(f"🚨 {data_len}B COBS > {self.payload_size}B limit")
 			print(f"🚨 This violates Opulent Voice Protocol timing requirements!")
 			# Could raise exception here if you want to catch this in testing
         
 		self.stats['multi_frame_messages'] += 1
-		frames = []
-        
-		for i in range(0, len(cobs_encoded_data), self.payload_size):
-			chunk = cobs_encoded_data[i:i + self.payload_size]
-            
-			# Pad last chunk to exactly payload_size bytes if needed
-			if len(chunk) < self.payload_size:
-				chunk = chunk + b'\x00' * (self.payload_size - len(chunk))
-            
-			frames.append(chunk)
-			self.stats['total_frames_created'] += 1
-        
+
 		# Track frame type statistics
 		if frame_type == "text":
-			self.stats['text_frames_created'] += len(frames)
+			self.stats['text_frames_created'] += frame_count
 		elif frame_type == "control":
-			self.stats['control_frames_created'] += len(frames)
+			self.stats['control_frames_created'] += frame_count
         
-		print(f"📦 {frame_type}: {len(cobs_encoded_data)}B COBS → {len(frames)} frames")
-		return frames
+		print(f"📦 {frame_type}: {data_len}B COBS → {frame_count} frames")
 
 	def get_stats(self):
 		"""Enhanced statistics with frame type breakdown"""
@@ -506,13 +551,19 @@ class SimpleFrameReassembler:
 	Simple frame reassembler - concatenates 122-byte payloads until COBS delimiter found
 	No fragmentation headers to worry about
 	"""
+
+	# Largest COBS packet we can be sent: a 65535-byte IP packet plus one
+	# overhead byte per 254 data bytes and the leading code byte
+	MAX_COBS_FRAME_SIZE = 65535 + 65535 // COBSEncoder.MAX_BLOCK_SIZE + 1
 	
 	def __init__(self):
 		self.buffer = bytearray()
+		self.discarding = False  # True while skipping the rest of an oversized packet
 		self.stats = {
 			'frames_received': 0,
 			'messages_completed': 0,
-			'bytes_buffered': 0
+			'bytes_buffered': 0,
+			'buffer_overflows': 0
 		}
 	
 
@@ -525,25 +576,57 @@ class SimpleFrameReassembler:
 
 
 
-	def add_frame_payload(self, frame_payload: bytes) -> list[bytes]:
+	def add_frame_payload(self, frame_payload: bytes, offset: int = 0) -> list[Union[bytes, bytearray]]:
+		"""
+		Reassemble COBS packets from frame_payload[offset:].
+
+		offset lets the receivers hand over a whole received frame and skip
+		its Opulent Voice header without copying the payload out first.
+		A packet that spanned several payloads is returned as the bytearray
+		it was reassembled in; the caller owns it from then on.
+		"""
 		self.stats['frames_received'] += 1
-		delimiter_pos = frame_payload.find(0, 0)
+		delimiter_pos = frame_payload.find(0, offset)
 		if delimiter_pos == -1:
+			if self.discarding:
+				return []   # still inside a packet that was too big to keep
+			if len(self.buffer) + len(frame_payload) - offset > self.MAX_COBS_FRAME_SIZE:
+				# No legal packet is this long, so the stream is corrupt. Drop
+				# what we have and skip ahead to the next delimiter rather
+				# than letting the buffer grow without bound.
+				self.stats['buffer_overflows'] += 1
+				DebugConfig.debug_print(f"⚠ Reassembly buffer overflow, dropping {len(self.buffer)}B")
+				self.buffer.clear()
+				self.discarding = True
+				return []
 			# no delimiter anywhere, just append the whole frame_payload
-			self.buffer.extend(frame_payload)   # this is cheap for a bytearray
+			self.buffer += memoryview(frame_payload)[offset:]   # this is cheap for a bytearray
 			return []   # no reassembled_frames were completed by this frame_payload.
     
 		# We've completed a packet, using up any existing contents of self.buffer.
-		reassembled_frames = [bytes(self.buffer + frame_payload[0:delimiter_pos])]
+		if self.discarding:
+			# This delimiter ends the oversized packet, nothing to hand over
+			self.discarding = False
+			reassembled_frames = []
+		elif self.buffer:
+			# Hand the filled buffer itself to the caller and start a new one,
+			# rather than copying a packet that may span many payloads
+			self.buffer += memoryview(frame_payload)[offset:delimiter_pos]
+			reassembled_frames = [self.buffer]
+			self.buffer = bytearray()
+		else:
+			reassembled_frames = [frame_payload[offset:delimiter_pos]]
     
 		# Now we are dealing with only the remains of frame_payload
+		find = frame_payload.find
+		payload_end = len(frame_payload)
 		start_pos = delimiter_pos + 1   # index into frame_payload
-		while start_pos < len(frame_payload):
-			delimiter_pos = frame_payload.find(0, start_pos)
+		while start_pos < payload_end:
+			delimiter_pos = find(0, start_pos)
 			if delimiter_pos == -1:
 				# We don't have another ending delimiter, so we're done for now.
 				# Save the remains of the frame, if any, in self.buffer
-				self.buffer[:] = frame_payload[start_pos:]
+				self.buffer[:] = memoryview(frame_payload)[start_pos:]
 				break  # ← BREAK instead of return
 			if delimiter_pos == start_pos:
 				# we have an extra delimiter of padding here, not a packet
@@ -662,13 +745,13 @@ class SimpleFrameReassembler:
 			if delimiter_pos != -1:
 				if delimiter_pos == 0:
 					# Delimiter at start, skip it
-					self.buffer = self.buffer[1:]
+					del self.buffer[:1]
 					continue
 				# Found a non-empty complete COBS frame, add it to the list
-				reassembled_frames.append(self.buffer[:delimiter_pos])	# don't include the delimiter
+				reassembled_frames.append(bytes(memoryview(self.buffer)[:delimiter_pos]))	# don't include the delimiter
 				self.stats['messages_completed'] += 1
-				# Remove processed data from buffer
-				self.buffer = self.buffer[delimiter_pos + 1:]	# don't include the delimiter
+				# Remove processed data from buffer in place
+				del self.buffer[:delimiter_pos + 1]	# drop the delimiter too
 
 		self.stats['bytes_buffered'] = len(self.buffer)
 		
@@ -693,6 +776,7 @@ class RTPHeader:
 	VERSION = 2
 	PT_OPUS = 96 # in the range 96 to 127
 	HEADER_SIZE = 12
+	HEADER_STRUCT = struct.Struct('!I I I')  # first word, timestamp, SSRC
 
 	# Opulent Voice Protocol Constants
 	OPULENT_VOICE_FRAME_DURATION_MS = 40
@@ -700,6 +784,11 @@ class RTPHeader:
 	OPULENT_VOICE_OPUS_PAYLOAD_SIZE = 80
 	OPULENT_VOICE_SAMPLES_PER_FRAME = 1920
 
+	# Read for every audio frame, so kept in slots rather than an instance dict
+	__slots__ = ('version', 'padding', 'extension', 'csrc_count', 'marker', 'payload_type',
+		'sequence_number', 'ssrc', 'timestamp_base', 'samples_per_frame', 'header_buffer',
+		'_first_word_const')
+
 	def __init__(self, payload_type=PT_OPUS, ssrc=None): # Synchronization Source (SSRC)
 							     # Identifies source of a stream of RTP packets
 							     # Value is randomly chosen and unique within session.
@@ -717,35 +806,42 @@ class RTPHeader:
 		self.ssrc = ssrc or self._generate_ssrc()
 		self.timestamp_base = int(time.time() * self.OPULENT_VOICE_SAMPLE_RATE) % (2**32)
 		self.samples_per_frame = self.OPULENT_VOICE_SAMPLES_PER_FRAME
+		self.header_buffer = bytearray(self.HEADER_SIZE)  # create_header packs into this
+
+		# Version, padding, extension, CSRC count and payload type are fixed for
+		# the session, so only the marker bit and sequence number vary per packet
+		self._first_word_const = (
+			((self.version & 0x3) << 30) |
+			((self.padding & 0x1) << 29) |
+			((self.extension & 0x1) << 28) |
+			((self.csrc_count & 0xF) << 24) |
+			((self.payload_type & 0x7F) << 16)
+			)
 
 	def _generate_ssrc(self):
 		return random.randint(1, 2**32 - 1)
 
 	def create_header(self, is_first_packet=False, custom_timestamp=None):
+		self.pack_header_into(self.header_buffer, 0, is_first_packet, custom_timestamp)
+		return bytes(self.header_buffer)
+
+	def pack_header_into(self, buffer, offset, is_first_packet=False, custom_timestamp=None):
+		"""Write the next RTP header into buffer at offset, same bytes as create_header"""
 		marker = 1 if is_first_packet else 0
 
 		if custom_timestamp is not None:
 			timestamp = custom_timestamp
 		else:
-			timestamp = (self.timestamp_base + (self.sequence_number * self.samples_per_frame)) % (2**32)
+			timestamp = (self.timestamp_base + (self.sequence_number * self.samples_per_frame)) & 0xFFFFFFFF
 		
-		first_word = (
-			(self.version << 30) |
-			(self.padding << 29) |
-			(self.extension << 28) |
-			(self.csrc_count << 24) |
-			(marker << 23) |
-			(self.payload_type << 16) |
-			self.sequence_number
-			)
-		
-		header = struct.pack('!I I I',
+		first_word = self._first_word_const | (marker << 23) | self.sequence_number
+
+		self.HEADER_STRUCT.pack_into(buffer, offset,
 			first_word,
 			timestamp,
 			self.ssrc)
 
-		self.sequence_number = (self.sequence_number + 1) % 65535
-		return header
+		self.sequence_number = (self.sequence_number + 1) & 0xFFFF  # RTP sequence numbers wrap at 2^16
 
 	def parse_header(self, header_bytes):
 		if len(header_bytes) < self.HEADER_SIZE:
@@ -787,26 +883,21 @@ class RTPAudioFrameBuilder:
 	"""
 	Combines RTP headers with Opus payloads for Opulent Voice transmission.
 	"""
+	__slots__ = ('station_id', 'rtp_header', 'is_talk_spurt_start', 'expected_opus_size')
+
 	def __init__(self, station_identifier, payload_type=RTPHeader.PT_OPUS):
 		self.station_id = station_identifier
 
-		ssrc = hash(str(station_identifier)) % (2**32)
-		if ssrc == 0:
-			ssrc = 1
+		# CRC-32 of the callsign: the same SSRC for this station on every run
+		# (str hashes are salted per interpreter, so hash() changed each restart)
+		ssrc = zlib.crc32(str(station_identifier).encode()) or 1
 
 		self.rtp_header = RTPHeader(payload_type = payload_type, ssrc = ssrc)
 		self.is_talk_spurt_start = True
 		self.expected_opus_size = RTPHeader.OPULENT_VOICE_OPUS_PAYLOAD_SIZE
 
 	def create_rtp_audio_frame(self, opus_packet, is_start_of_transmission = False):
-		# Validate that we have 80 bytes
-		if len(opus_packet) != self.expected_opus_size:
-			raise ValueError(
-				f"Opulent Voice Protocol violation: OPUS packet must be "
-				f"{self.expected_opus_size} bytes, but we got {len(opus_packet)} bytes."
-				)
-		marker = is_start_of_transmission or self.is_talk_spurt_start
-		self.is_talk_spurt_start = False
+		marker = self._next_marker(opus_packet, is_start_of_transmission)
 
 		rtp_header = self.rtp_header.create_header(is_first_packet = marker)
 		rtp_frame = rtp_header + opus_packet
@@ -819,6 +910,25 @@ class RTPAudioFrameBuilder:
 				)
 		return rtp_frame
 
+	def pack_rtp_audio_frame_into(self, buffer, offset, opus_packet, is_start_of_transmission = False):
+		"""Write RTP header + OPUS payload into buffer at offset, same bytes as create_rtp_audio_frame"""
+		marker = self._next_marker(opus_packet, is_start_of_transmission)
+
+		self.rtp_header.pack_header_into(buffer, offset, is_first_packet = marker)
+		payload_offset = offset + RTPHeader.HEADER_SIZE
+		buffer[payload_offset:payload_offset + self.expected_opus_size] = opus_packet
+
+	def _next_marker(self, opus_packet, is_start_of_transmission):
+		# Validate that we have 80 bytes
+		if len(opus_packet) != self.expected_opus_size:
+			raise ValueError(
+				f"Opulent Voice Protocol violation: OPUS packet must be "
+				f"{self.expected_opus_size} bytes, but we got {len(opus_packet)} bytes."
+				)
+		marker = is_start_of_transmission or self.is_talk_spurt_start
+		self.is_talk_spurt_start = False
+		return marker
+
 	def validate_opus_packet(self, opus_packet):
 		return len(opus_packet) == self.expected_opus_size
 
@@ -839,6 +949,24 @@ class RTPAudioFrameBuilder:
 		return stats
 
 
+def _ones_complement_sum(data) -> int:
+	"""
+	16-bit one's complement sum of data (RFC 1071), zero-padded to even length
+
+	Rather than adding words one at a time, the whole buffer is read as one
+	big-endian integer. 2**16 is 1 modulo 0xFFFF, so that integer modulo 0xFFFF
+	is the end-around-carry sum of its 16-bit words, computed in C. A result
+	of 0 from nonzero data is the one's complement "negative zero", 0xFFFF.
+	"""
+	if len(data) % 2:
+		data = bytes(data) + b'\x00'
+
+	total = int.from_bytes(data, 'big') % 0xFFFF
+	if total == 0 and any(data):
+		return 0xFFFF
+	return total
+
+
 class UDPHeader:
 	"""
 	UDP Header implementation following RFC 768
@@ -855,6 +983,9 @@ class UDPHeader:
 	"""
 	
 	HEADER_SIZE = 8
+	HEADER_STRUCT = struct.Struct('!HHHH')  # source port, dest port, length, checksum
+
+	__slots__ = ('source_port', 'dest_port', '_pseudo_key', '_pseudo_sum')
 
 	def __init__(self, source_port=None, dest_port=57372):
 		"""
@@ -866,6 +997,11 @@ class UDPHeader:
 		self.source_port = source_port or self._get_ephemeral_port()
 		self.dest_port = dest_port
 
+		# Checksum of the fields that stay fixed for the last address pair used:
+		# pseudo-header addresses and protocol, plus the two ports
+		self._pseudo_key = None
+		self._pseudo_sum = 0
+
 	def _get_ephemeral_port(self):
 		"""Get an ephemeral port number (49152-65535 range)"""
 		return random.randint(49152, 65535)
@@ -876,8 +1012,8 @@ class UDPHeader:
 
 		payload_data: The data to be wrapped in UDP
 		calculate_checksum: Whether to calculate checksum (can be disabled for speed)
-		source_ip: Source IP address
-		dest_ip: Destination IP address
+		source_ip: Source IP address (required when calculate_checksum is True)
+		dest_ip: Destination IP address (required when calculate_checksum is True)
 		return: 8-byte UDP header
 		"""
 
@@ -887,11 +1023,11 @@ class UDPHeader:
 		if udp_length > 65535:
 			raise ValueError(f"UDP packet way too big: {udp_length} bytes")
 
-		# Calculate checksum if requested
-		if calculate_checksum and source_ip and dest_ip:
+		# Calculate checksum if requested; the RFC 768 checksum needs both addresses
+		if calculate_checksum:
+			if not (source_ip and dest_ip):
+				raise ValueError("UDP checksum requires source and destination IP addresses")
 			checksum = self._calculate_checksum(payload_data, udp_length, source_ip, dest_ip)
-		elif calculate_checksum:
-			checksum = self._simple_checksum(payload_data, udp_length) #fallback
 		else:
 			checksum = 0  # Checksum optional in IPv4
 
@@ -914,89 +1050,31 @@ class UDPHeader:
 
 		payload_data: UDP payload
 		udp_length: UDP header + payload length
-		source_ip: Source IP address (string format)
-		dest_ip: Destination IP address (string format)
+		source_ip: Source IP address (dotted string, or 4 bytes already packed)
+		dest_ip: Destination IP address (dotted string, or 4 bytes already packed)
 		return: 16-bit checksum
 		"""
-		# Convert IP addresses to network byte order integers using socket.inet_aton
-		try:
-			source_addr = struct.unpack("!I", socket.inet_aton(source_ip))[0]
-			dest_addr = struct.unpack("!I", socket.inet_aton(dest_ip))[0]
-		except socket.error:
-			# Fallback to simple checksum if IP conversion fails
-			return self._simple_checksum(payload_data, udp_length)
-
-		# Create proper 12-byte UDP pseudo-header per RFC 768
-		# Format: Source IP (4) + Dest IP (4) + Zero (1) + Protocol (1) + UDP Length (2)
-		pseudo_header = struct.pack('!IIBBH',
-			source_addr,	# Source IP (4 bytes)
-			dest_addr,	# Dest IP (4 bytes)
-			0,		# Zero byte (1 byte)
-			17,		# Protocol = UDP (1 byte) 
-			udp_length	# UDP Length (2 bytes)
-		)
-
-		# Create UDP header with zero checksum for calculation
-		udp_header = struct.pack('!HHHH',
-			self.source_port,
-			self.dest_port,
-			udp_length,
-			0  # Zero checksum for calculation
-		)
-
-		# Combine pseudo-header + UDP header + payload
-		checksum_data = pseudo_header + udp_header + payload_data
-
-		# Pad to even length if necessary
-		if len(checksum_data) % 2:
-			checksum_data += b'\x00'
-
-		# Calculate 16-bit ones complement checksum
-		checksum = 0
-		for i in range(0, len(checksum_data), 2):
-			word = (checksum_data[i] << 8) + checksum_data[i + 1]
-			checksum += word
-			
-			# Handle carries immediately to prevent overflow
-			while checksum > 0xFFFF:
-				checksum = (checksum & 0xFFFF) + (checksum >> 16)
-
-		# Take one's complement
-		checksum = (~checksum) & 0xFFFF
-
-		# UDP checksum of 0 is invalid, use 0xFFFF instead
-		if checksum == 0:
-			checksum = 0xFFFF
-
-		return checksum
-
-	def _simple_checksum(self, payload_data, udp_length):
-		"""
-		Simplified checksum when no IP addresses are available
-		Note: This is not RFC-compliant but better than nothing
-		"""
-		# Create simplified pseudo UDP packet for checksum calculation
-		pseudo_header = struct.pack('!HHHH',
-			self.source_port,
-			self.dest_port,
-			udp_length,
-			0  # Checksum field zero for calculation
-		)
-
-		# Combine header and payload for checksum
-		checksum_data = pseudo_header + payload_data
+		# Checksummed data is the 12-byte pseudo-header per RFC 768
+		# (Source IP (4) + Dest IP (4) + Zero (1) + Protocol (1) + UDP Length (2)),
+		# the UDP header with a zero checksum, then the payload. One's complement
+		# sums can be added in any grouping, so the fixed words are summed once
+		# per address pair and each packet only adds its length and payload.
+		key = (source_ip, dest_ip, self.source_port, self.dest_port)
+		if key != self._pseudo_key:
+			try:
+				source_addr = source_ip if isinstance(source_ip, bytes) else socket.inet_aton(source_ip)
+				dest_addr = dest_ip if isinstance(dest_ip, bytes) else socket.inet_aton(dest_ip)
+			except (socket.error, TypeError):
+				raise ValueError(f"Invalid IP address for UDP checksum: {source_ip!r} -> {dest_ip!r}")
 
-		# Pad to even length
-		if len(checksum_data) % 2:
-			checksum_data += b'\x00'
+			self._pseudo_sum = _ones_complement_sum(
+				source_addr + dest_addr + struct.pack('!BBHH', 0, 17, self.source_port, self.dest_port))
+			self._pseudo_key = key
 
-		# Calculate 16-bit checksum
-		checksum = 0
-		for i in range(0, len(checksum_data), 2):
-			word = (checksum_data[i] << 8) + checksum_data[i + 1]
-			checksum += word
-			while checksum > 0xFFFF:
-				checksum = (checksum & 0xFFFF) + (checksum >> 16)
+		# UDP length appears twice: in the pseudo-header and in the UDP header
+		checksum = self._pseudo_sum + udp_length + udp_length + _ones_complement_sum(payload_data)
+		checksum = (checksum & 0xFFFF) + (checksum >> 16)
+		checksum = (checksum & 0xFFFF) + (checksum >> 16)
 
 		# Take one's complement
 		checksum = (~checksum) & 0xFFFF
@@ -1017,7 +1095,7 @@ class UDPHeader:
 		if len(header_bytes) < self.HEADER_SIZE:
 			raise ValueError(f"UDP header too short: {len(header_bytes)} bytes")
 
-		source_port, dest_port, length, checksum = struct.unpack('!HHHH', header_bytes)
+		source_port, dest_port, length, checksum = self.HEADER_STRUCT.unpack_from(header_bytes)
 
 		return {
 			'source_port': source_port,
@@ -1203,6 +1281,70 @@ class UDPControlFrameBuilder:
 		}
 
 
+# Local IP detection results, keyed by destination IP.
+# Shared by every IPHeader so building one doesn't open a socket each time.
+_local_ip_cache: Dict[str, str] = {}
+
+
+# ioctl request for an interface's IPv4 address (Linux)
+SIOCGIFADDR = 0x8915
+
+
+def _probe_local_ip(dest_ip: str) -> str:
+	"""Ask the kernel which local address routes to dest_ip, or None if it can't say"""
+	try:
+		# Connect to our target address to determine our IP address
+		with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+			s.connect((dest_ip, 80))
+			return s.getsockname()[0]
+	except OSError:
+		return None
+
+
+def _default_route_ip() -> str:
+	"""Address of the interface holding the IPv4 default route (Linux), or None"""
+	try:
+		import fcntl
+		with open('/proc/net/route') as routes:
+			next(routes)  # column headings
+			for line in routes:
+				fields = line.split()
+				if len(fields) > 1 and fields[1] == '00000000':
+					with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+						ifreq = fcntl.ioctl(s.fileno(), SIOCGIFADDR, struct.pack('256s', fields[0][:15].encode()))
+					return socket.inet_ntoa(ifreq[20:24])
+	except (ImportError, OSError, StopIteration):
+		pass
+	return None
+
+
+def get_local_ip(dest_ip: str) -> str:
+	"""
+	Returns the local IP address used to reach dest_ip, probing only once.
+
+	If the route lookup fails (e.g. the network isn't up yet), the default
+	route's interface address is used instead, and failing that 127.0.0.1.
+	Fallback answers are not cached, so the next call probes again.
+
+	:param dest_ip: Destination IP address.
+	:return: Local IP address in dotted string form.
+	"""
+	local_ip = _local_ip_cache.get(dest_ip)
+	if local_ip is None:
+		local_ip = _probe_local_ip(dest_ip)
+		if local_ip is None:
+			local_ip = _default_route_ip() or "127.0.0.1"
+			DebugConfig.system_print(f"⚠ No route to {dest_ip} yet, using local IP {local_ip}")
+		else:
+			_local_ip_cache[dest_ip] = local_ip
+	return local_ip
+
+
+def invalidate_local_ip_cache():
+	"""Forget detected local IPs, e.g. after a network change"""
+	_local_ip_cache.clear()
+
+
 class IPHeader:
 	"""
 	IPv4 Header implementation following RFC 791
@@ -1224,9 +1366,13 @@ class IPHeader:
 	"""
 
 	HEADER_SIZE = 20  # Standard IPv4 header without options
+	HEADER_STRUCT = struct.Struct('!BBHHHBBH4s4s')
 	VERSION = 4       # IPv4
 	PROTOCOL_UDP = 17 # UDP protocol number. TCP is 6.
 
+	__slots__ = ('version', 'ihl', 'tos', 'identification', 'flags', 'fragment_offset',
+		'ttl', 'protocol', 'dest_ip', 'source_ip', 'source_addr', 'dest_addr')
+
 	def __init__(self, source_ip=None, dest_ip="192.168.1.100"):
 		"""
 		Initialize IP header builder
@@ -1243,36 +1389,29 @@ class IPHeader:
 		self.ttl = 64  # Time to Live (standard value)
 		self.protocol = self.PROTOCOL_UDP
 
-		# IP addresses
-		self.source_ip = source_ip or self._get_local_ip()
+		# IP addresses (dest first, local IP detection routes toward it)
 		self.dest_ip = dest_ip
+		self.source_ip = source_ip or self._get_local_ip()
 
 		# Convert IP addresses to 32-bit integers, from RFC 791
 		self.source_addr = self._ip_to_int(self.source_ip)
 		self.dest_addr = self._ip_to_int(self.dest_ip)
 
 	def _generate_packet_id(self):
-		"""Generate a packet identification number"""
-		return random.randint(1, 65535)
+		"""Generate a starting packet identification number (incremented per packet)"""
+		return int.from_bytes(os.urandom(2), 'big') or 1
 
 	def _get_local_ip(self):
-		"""Auto-detect local IP address"""
-		try:
-			# Connect to our target address to determine our IP address
-			with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-				s.connect((self.dest_ip, 80))
-				return s.getsockname()[0]
-		except:
-			return "127.0.0.1"  # Fallback to localhost if all else fails
+		"""Auto-detect local IP address (cached per destination)"""
+		return get_local_ip(self.dest_ip)
 
 	def _ip_to_int(self, ip_str):
 		"""Convert IP address string to 32-bit integer"""
-		parts = [int(x) for x in ip_str.split('.')]
-		return (parts[0] << 24) + (parts[1] << 16) + (parts[2] << 8) + parts[3]
+		return int.from_bytes(socket.inet_aton(ip_str), 'big')
 
 	def _int_to_ip(self, ip_int):
 		"""Convert 32-bit integer to IP address string"""
-		return f"{(ip_int >> 24) & 0xFF}.{(ip_int >> 16) & 0xFF}.{(ip_int >> 8) & 0xFF}.{ip_int & 0xFF}"
+		return socket.inet_ntoa((ip_int & 0xFFFFFFFF).to_bytes(4, 'big'))
 
 	def create_header(self, payload_data):
 		"""
@@ -1288,15 +1427,15 @@ class IPHeader:
 			raise ValueError(f"IP packet way too large: {total_length} bytes")
 
 		# Increment packet ID for each packet
-		self.identification = (self.identification + 1) % 65536
+		self.identification = (self.identification + 1) & 0xFFFF
 
-		# Create header without checksum first, 
-		# then use to calculate checksum, then create
-		# final checksum. 
+		# Pack the header once with a zero checksum, calculate the
+		# checksum over it, then patch the checksum field in place
 		version_ihl = (self.version << 4) | self.ihl
 		flags_fragment = (self.flags << 13) | self.fragment_offset
 
-		header_without_checksum = struct.pack('!BBHHHBBH4s4s',
+		header = bytearray(self.HEADER_SIZE)
+		self.HEADER_STRUCT.pack_into(header, 0,
 			version_ihl,
 			self.tos,
 			total_length,
@@ -1310,36 +1449,14 @@ class IPHeader:
 		)
 
 		# Calculate header checksum
-		checksum = self._calculate_checksum(header_without_checksum)
-
-		# Create final header with checksum
-		header = struct.pack('!BBHHHBBH4s4s',
-			version_ihl,
-			self.tos,
-			total_length,
-			self.identification,
-			flags_fragment,
-			self.ttl,
-			self.protocol,
-			checksum,
-			self.source_addr.to_bytes(4, 'big'),
-			self.dest_addr.to_bytes(4, 'big')
-		)
+		struct.pack_into('!H', header, 10, self._calculate_checksum(header))
 
-		return header
+		return bytes(header)
 
 	def _calculate_checksum(self, header_data):
 		"""Calculate IP header checksum"""
-		# Ensure even length
-		if len(header_data) % 2:
-			header_data += b'\x00'
-
-		# Sum all 16-bit words
-		checksum = 0
-		for i in range(0, len(header_data), 2):
-			word = (header_data[i] << 8) + header_data[i + 1]
-			checksum += word
-			checksum = (checksum & 0xFFFF) + (checksum >> 16)
+		# Sum all 16-bit words (padded to even length)
+		checksum = _ones_complement_sum(header_data)
 
 		# One's complement
 		return (~checksum) & 0xFFFF
@@ -1597,6 +1714,13 @@ class OpulentVoiceProtocolWithIP:
 	PROTOCOL_PORT_TEXT = 57374
 	PROTOCOL_PORT_CONTROL = 57375
 
+	# Opulent Voice header: station ID (6B), token (3B), reserved (3B)
+	OV_HEADER = struct.Struct('>6s 3s 3s')
+
+	# Audio frames have a fixed layout, so their IP (20B) and UDP (8B)
+	# headers are packed together by one precompiled struct
+	AUDIO_IP_UDP_HEADER = struct.Struct('!BBHHHBBH4s4sHHHH')
+
 	def __init__(self, station_identifier, dest_ip="192.168.1.100"):
 		"""Initialize protocol with IP support - Simple frame splitting approach"""
 		self.station_id = station_identifier
@@ -1608,6 +1732,10 @@ class OpulentVoiceProtocolWithIP:
 		# Cache source IP once at startup
 		self.source_ip = self._get_local_ip_once()
 
+		# Packed forms for the UDP pseudo-header, so no frame has to parse the dotted strings
+		self.source_ip_packed = socket.inet_aton(self.source_ip)
+		self.dest_ip_packed = socket.inet_aton(self.dest_ip)
+
 		# COBS manager for frame boundary detection
 		self.cobs_manager = COBSFrameBoundaryManager()
 
@@ -1626,6 +1754,17 @@ class OpulentVoiceProtocolWithIP:
 
 		# FIXED: Use 134-byte frames with 122-byte payload
 		self.frame_splitter = SimpleFrameSplitter(opulent_voice_frame_size=134)
+
+		# Header bytes that never change for this station are built once
+		self.ov_header = self.OV_HEADER.pack(self.station_id_bytes, self.TOKEN, self.RESERVED)
+
+		# One 120-byte IP audio frame buffer, rewritten in place for every voice frame
+		self.audio_ip_frame = self._build_audio_frame_buffer()
+
+		# Likewise one 134-byte OV audio frame; COBS output is written straight
+		# after the header and the rest is zero-filled from a constant
+		self.audio_ov_frame = bytearray(self.ov_header) + bytearray(self.frame_splitter.payload_size)
+		self.ov_padding = memoryview(bytes(len(self.audio_ov_frame)))
         
 		# Validate audio frame sizing
 		self._validate_audio_frame_sizing()
@@ -1659,124 +1798,160 @@ class OpulentVoiceProtocolWithIP:
 	def create_audio_frames(self, opus_packet, is_start_of_transmission=False):
 		"""
 		ENHANCED: Audio frame creation with split detection and validation
+		Returns a list holding one 134-byte frame, which the caller may keep
 		"""
-		rtp_frame = self.rtp_builder.create_rtp_audio_frame(
-			opus_packet,
-			is_start_of_transmission
-		)
-        
-		udp_frame = self.udp_audio_builder.create_udp_audio_frame(
-			rtp_frame,
-			source_ip=self.source_ip,
-			dest_ip=self.dest_ip
-		)
-        
-		ip_frame = self.ip_audio_builder.create_ip_audio_frame(udp_frame)
-        
+		ip_frame = self._create_ip_audio_frame(opus_packet, is_start_of_transmission)
+
 		# COBS encode the complete IP frame
 		cobs_frame = self.cobs_manager.encode_frame(ip_frame)
-		#print(f"🔍 Audio frame sizes: RTP({len(rtp_frame)}B) → UDP({len(udp_frame)}B) → IP({len(ip_frame)}B) → COBS({len(cobs_frame)}B)")
-        
-		# CRITICAL: Split with frame type tracking
-		frame_payloads = self.frame_splitter.split_cobs_frame(cobs_frame, frame_type="audio")
+		#print(f"🔍 Audio frame sizes: IP({len(ip_frame)}B) → COBS({len(cobs_frame)}B)")
         
 		# ASSERT: Audio must never split
-		if len(frame_payloads) > 1:
-			error_msg = f"CRITICAL ERROR: Audio frame split into {len(frame_payloads)} parts!"
+		if len(cobs_frame) > self.frame_splitter.payload_size:
+			payload_size = self.frame_splitter.payload_size
+			frame_count = (len(cobs_frame) + payload_size - 1) // payload_size
+			self.frame_splitter._count_frames(len(cobs_frame), frame_count, "audio")
+			error_msg = f"CRITICAL ERROR: Audio frame split into {frame_count} parts!"
 			print(f"🚨 {error_msg}")
 			print(f"🚨 IP: {len(ip_frame)}B, COBS: {len(cobs_frame)}B, Limit: {self.frame_splitter.payload_size}B")
 			raise RuntimeError(error_msg)
-        
-		# Add Opulent Voice headers
-		ov_frames = []
-		for payload in frame_payloads:
-			ov_header = struct.pack(
-				'>6s 3s 3s',
-				self.station_id_bytes,
-				self.TOKEN,
-				self.RESERVED
-			)
-			ov_frame = ov_header + payload
-            
-			# Validate frame size
-			if len(ov_frame) != 134:
-				raise RuntimeError(f"Frame size error: {len(ov_frame)}B != 134B")
-                
-			ov_frames.append(ov_frame)
 
-		return ov_frames
+		# Write the COBS frame after the OV header and zero-pad the rest in place,
+		# instead of padding it and then joining it to the header
+		ov_frame = self.audio_ov_frame
+		end = self.HEADER_SIZE + len(cobs_frame)
+		ov_frame[self.HEADER_SIZE:end] = cobs_frame
+		ov_frame[end:] = self.ov_padding[end:]
+		self.frame_splitter.stats['single_frame_messages'] += 1
+		self.frame_splitter.stats['total_frames_created'] += 1
+
+		# The build buffer is reused by the next call, so hand out a copy
+		return [bytes(ov_frame)]
+
+	def _build_audio_frame_buffer(self):
+		"""
+		Allocate the IP audio frame buffer with its IP (20B) and UDP (8B) headers filled in
+		Only the IP identification, the two checksums and the RTP frame change per frame
+		"""
+		ip_header = self.ip_audio_builder.ip_header
+		udp_header = self.udp_audio_builder.udp_header
+
+		udp_length = UDPHeader.HEADER_SIZE + RTPHeader.HEADER_SIZE + RTPHeader.OPULENT_VOICE_OPUS_PAYLOAD_SIZE
+		total_length = IPHeader.HEADER_SIZE + udp_length
+
+		frame = bytearray(total_length)
+		self.AUDIO_IP_UDP_HEADER.pack_into(frame, 0,
+			(ip_header.version << 4) | ip_header.ihl,
+			ip_header.tos,
+			total_length,
+			ip_header.identification,
+			(ip_header.flags << 13) | ip_header.fragment_offset,
+			ip_header.ttl,
+			ip_header.protocol,
+			0,  # IP checksum, filled in below and then updated incrementally
+			ip_header.source_addr.to_bytes(4, 'big'),
+			ip_header.dest_addr.to_bytes(4, 'big'),
+			udp_header.source_port,
+			udp_header.dest_port,
+			udp_length,
+			0   # UDP checksum, patched per frame
+		)
+		struct.pack_into('!H', frame, 10, ip_header._calculate_checksum(frame[:IPHeader.HEADER_SIZE]))
+		return frame
+
+	def _create_ip_audio_frame(self, opus_packet, is_start_of_transmission=False):
+		"""
+		Build the complete IP/UDP/RTP audio frame in place in self.audio_ip_frame
+		Same bytes as the RTP, UDP and IP audio builders chained together.
+		The returned buffer is reused by the next call, so encode it straight away.
+		"""
+		ip_header = self.ip_audio_builder.ip_header
+		udp_header = self.udp_audio_builder.udp_header
+		frame = self.audio_ip_frame
+		rtp_offset = IPHeader.HEADER_SIZE + UDPHeader.HEADER_SIZE
+
+		# RTP header and OPUS payload go straight into the frame (size is validated here)
+		self.rtp_builder.pack_rtp_audio_frame_into(frame, rtp_offset, opus_packet, is_start_of_transmission)
+		udp_length = len(frame) - IPHeader.HEADER_SIZE
+
+		# Only the identification changed since the last frame, so update the
+		# IP checksum incrementally: HC' = ~(~HC + ~m + m')  (RFC 1624, eqn. 3)
+		old_id, old_checksum = struct.unpack_from('!H4xH', frame, 4)
+		ip_header.identification = (ip_header.identification + 1) & 0xFFFF
+		checksum = (~old_checksum & 0xFFFF) + (~old_id & 0xFFFF) + ip_header.identification
+		checksum = (checksum & 0xFFFF) + (checksum >> 16)
+		checksum = (checksum & 0xFFFF) + (checksum >> 16)
+		struct.pack_into('!H', frame, 4, ip_header.identification)
+		struct.pack_into('!H', frame, 10, ~checksum & 0xFFFF)
+
+		rtp_frame = memoryview(frame)[rtp_offset:]
+		struct.pack_into('!H', frame, 26,
+			udp_header._calculate_checksum(rtp_frame, udp_length, self.source_ip_packed, self.dest_ip_packed))
+		rtp_frame.release()
+
+		return frame
 
 	def create_text_frames(self, text_data):
 		"""ENHANCED: Text frame creation with frame type tracking"""
+		return self.create_frames_from_packet(self.create_text_packet(text_data), frame_type="text")
+
+	def create_control_frames(self, control_data):
+		"""ENHANCED: Control frame creation with frame type tracking"""
+		return self.create_frames_from_packet(self.create_control_packet(control_data), frame_type="control")
+
+	def create_text_packet(self, text_data):
+		"""Build the COBS-encoded IP/UDP text packet, delimiter included"""
 		if isinstance(text_data, str):
 			text_data = text_data.encode('utf-8')
 
 		udp_frame = self.udp_text_builder.create_udp_text_frame(
 			text_data,
-			source_ip=self.source_ip,
-			dest_ip=self.dest_ip
+			source_ip=self.source_ip_packed,
+			dest_ip=self.dest_ip_packed
 		)
 
 		ip_frame = self.ip_text_builder.create_ip_text_frame(udp_frame)
-		cobs_frame = self.cobs_manager.encode_frame(ip_frame)
-        
-		# Split with frame type tracking
-		frame_payloads = self.frame_splitter.split_cobs_frame(cobs_frame, frame_type="text")
-
-		# Add Opulent Voice headers
-		ov_frames = []
-		for payload in frame_payloads:
-			ov_header = struct.pack(
-				'>6s 3s 3s',
-				self.station_id_bytes,
-				self.TOKEN,
-				self.RESERVED
-			)
-			ov_frame = ov_header + payload
-            
-			# Validate frame size
-			if len(ov_frame) != 134:
-				raise RuntimeError(f"Frame size error: {len(ov_frame)}B != 134B")
-                
-			ov_frames.append(ov_frame)
+		return self.cobs_manager.encode_frame(ip_frame)
 
-		return ov_frames
-
-	def create_control_frames(self, control_data):
-		"""ENHANCED: Control frame creation with frame type tracking"""
+	def create_control_packet(self, control_data):
+		"""Build the COBS-encoded IP/UDP control packet, delimiter included"""
 		if isinstance(control_data, str):
 			control_data = control_data.encode('utf-8')
 
 		udp_frame = self.udp_control_builder.create_udp_control_frame(
 			control_data,
-			source_ip=self.source_ip,
-			dest_ip=self.dest_ip
+			source_ip=self.source_ip_packed,
+			dest_ip=self.dest_ip_packed
 		)
 
 		ip_frame = self.ip_control_builder.create_ip_control_frame(udp_frame)
-		cobs_frame = self.cobs_manager.encode_frame(ip_frame)
-        
-		# Split with frame type tracking  
-		frame_payloads = self.frame_splitter.split_cobs_frame(cobs_frame, frame_type="control")
-
-		# Add Opulent Voice headers
-		ov_frames = []
-		for payload in frame_payloads:
-			ov_header = struct.pack(
-				'>6s 3s 3s',
-				self.station_id_bytes,
-				self.TOKEN,
-				self.RESERVED
+		return self.cobs_manager.encode_frame(ip_frame)
+
+	def create_frames_from_packet(self, cobs_frame, frame_type="unknown"):
+		"""Split one COBS packet into as many 134-byte OV frames as it needs"""
+		# Split and add Opulent Voice headers in one pass, with frame type tracking
+		return self.frame_splitter.split_into_ov_frames(cobs_frame, self.ov_header, frame_type=frame_type)
+
+	def create_coalesced_frames(self, cobs_packets):
+		"""
+		Pack several whole COBS packets into a single OV frame
+		Each packet ends in its own delimiter, so receivers split them apart
+		exactly as they do for a packet followed by padding
+		Returns a one-frame list, like the other create_*_frames methods.
+		"""
+		payload_size = sum(map(len, cobs_packets))
+		if payload_size > self.frame_splitter.payload_size:
+			raise ValueError(
+				f"Coalesced packets need {payload_size}B, "
+				f"only {self.frame_splitter.payload_size}B available"
 			)
-			ov_frame = ov_header + payload
-            
-			# Validate frame size
-			if len(ov_frame) != 134:
-				raise RuntimeError(f"Frame size error: {len(ov_frame)}B != 134B")
-                
-			ov_frames.append(ov_frame)
 
-		return ov_frames
+		# Header, packets and padding joined in one allocation
+		padding = self.ov_padding[self.HEADER_SIZE + payload_size:]
+		ov_frame = b"".join((self.ov_header, *cobs_packets, padding))
+		self.frame_splitter.stats['single_frame_messages'] += 1
+		self.frame_splitter.stats['total_frames_created'] += 1
+		return [ov_frame]
 
 
 
@@ -1938,13 +2113,8 @@ class OpulentVoiceProtocolWithIP:
 
 
 	def _get_local_ip_once(self):
-		"""Get local IP address once at startup"""
-		try:
-			with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-				s.connect((self.dest_ip, 80))
-			return s.getsockname()[0]
-		except:
-			return "127.0.0.1"
+		"""Get local IP address once at startup (shared with the IPHeader lookup)"""
+		return get_local_ip(self.dest_ip)
 
 
 
@@ -2032,7 +2202,7 @@ class QueuedMessage:
 		return self.timestamp < other.timestamp
 
 
-class FrameType(Enum):
+class FrameType(IntEnum):
 	"""Types of 40ms frames"""
 	VOICE = 1      # Audio/voice transmission
 	CONTROL = 2    # Control messages (A5 auth, system commands)
@@ -2040,7 +2210,7 @@ class FrameType(Enum):
 	DATA = 4       # Data transfer (skip for now)
 	KEEPALIVE = 5  # Background keepalive
 
-class FramePriority(Enum):
+class FramePriority(IntEnum):
 	"""Frame priority levels - Voice > Control > Text > Data"""
 	VOICE = 1      # Highest - interrupts everything
 	CONTROL = 2    # High - A5 auth, system control
@@ -2049,6 +2219,201 @@ class FramePriority(Enum):
 	KEEPALIVE = 5  # Lowest
 
 
+# Batched datagram I/O (Linux recvmmsg/sendmmsg via ctypes)
+
+class _IOVec(ctypes.Structure):
+	"""struct iovec"""
+	_fields_ = [
+		('iov_base', ctypes.c_void_p),
+		('iov_len', ctypes.c_size_t)
+	]
+
+
+class _MsgHdr(ctypes.Structure):
+	"""struct msghdr"""
+	_fields_ = [
+		('msg_name', ctypes.c_void_p),
+		('msg_namelen', ctypes.c_uint32),
+		('msg_iov', ctypes.POINTER(_IOVec)),
+		('msg_iovlen', ctypes.c_size_t),
+		('msg_control', ctypes.c_void_p),
+		('msg_controllen', ctypes.c_size_t),
+		('msg_flags', ctypes.c_int)
+	]
+
+
+class _MMsgHdr(ctypes.Structure):
+	"""struct mmsghdr"""
+	_fields_ = [
+		('msg_hdr', _MsgHdr),
+		('msg_len', ctypes.c_uint)
+	]
+
+
+def _load_libc_function(name):
+	"""Return a libc function by name, or None if this platform lacks it"""
+	try:
+		return getattr(ctypes.CDLL(None, use_errno=True), name)
+	except (AttributeError, OSError):
+		return None
+
+
+_libc_recvmmsg = _load_libc_function('recvmmsg')
+if _libc_recvmmsg:
+	_libc_recvmmsg.argtypes = (ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p)
+	_libc_recvmmsg.restype = ctypes.c_int
+
+_libc_sendmmsg = _load_libc_function('sendmmsg')
+if _libc_sendmmsg:
+	_libc_sendmmsg.argtypes = (ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int)
+	_libc_sendmmsg.restype = ctypes.c_int
+
+
+class BatchedDatagramReceiver:
+	"""
+	Drains queued UDP datagrams from a socket, many per system call
+
+	On Linux this uses recvmmsg(2) with buffers allocated once up front,
+	so a burst of Opulent Voice frames costs one syscall instead of one
+	each. Elsewhere it falls back to a single recvfrom() per call.
+	The socket should be non-blocking; wait for readability first.
+	"""
+
+	SOCKADDR_IN_SIZE = 16
+
+	def __init__(self, sock, batch_size=16, buffer_size=4096):
+		self.socket = sock
+		self.batch_size = batch_size
+		self.buffer_size = buffer_size
+		self.batched = _libc_recvmmsg is not None and sock.family == socket.AF_INET
+
+		if self.batched:
+			self.buffers = [ctypes.create_string_buffer(buffer_size) for _ in range(batch_size)]
+			self.addresses = [ctypes.create_string_buffer(self.SOCKADDR_IN_SIZE) for _ in range(batch_size)]
+			self.iovecs = (_IOVec * batch_size)()
+			self.headers = (_MMsgHdr * batch_size)()
+			for i in range(batch_size):
+				self.iovecs[i].iov_base = ctypes.addressof(self.buffers[i])
+				self.iovecs[i].iov_len = buffer_size
+				msg_hdr = self.headers[i].msg_hdr
+				msg_hdr.msg_name = ctypes.addressof(self.addresses[i])
+				msg_hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+				msg_hdr.msg_iovlen = 1
+
+	def receive(self):
+		"""Return a list of (data, addr) for every datagram waiting, possibly empty"""
+		if not self.batched:
+			try:
+				return [self.socket.recvfrom(self.buffer_size)]
+			except BlockingIOError:
+				return []
+
+		headers = self.headers
+		for i in range(self.batch_size):
+			headers[i].msg_hdr.msg_namelen = self.SOCKADDR_IN_SIZE
+
+		count = _libc_recvmmsg(self.socket.fileno(), headers, self.batch_size, socket.MSG_DONTWAIT, None)
+		if count < 0:
+			error = ctypes.get_errno()
+			if error in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+				return []
+			raise OSError(error, os.strerror(error))
+
+		datagrams = []
+		for i in range(count):
+			address = self.addresses[i].raw
+			addr = (socket.inet_ntoa(address[4:8]), struct.unpack('!H', address[2:4])[0])
+			datagrams.append((ctypes.string_at(self.buffers[i], headers[i].msg_len), addr))
+		return datagrams
+
+
+class BatchedDatagramSender:
+	"""
+	Sends a burst of UDP datagrams on a connected socket, many per system call
+
+	On Linux this uses sendmmsg(2) with buffers allocated once up front.
+	Elsewhere it falls back to one send() per datagram.
+	The buffers are shared, so one burst is filled and sent at a time.
+	"""
+
+	def __init__(self, sock, batch_size=16, buffer_size=4096):
+		self.socket = sock
+		self.batch_size = batch_size
+		self.buffer_size = buffer_size
+		self.batched = _libc_sendmmsg is not None
+		self.lock = threading.Lock()  # PTT handlers can send from several threads
+
+		if self.batched:
+			self.buffers = [ctypes.create_string_buffer(buffer_size) for _ in range(batch_size)]
+			self.views = [memoryview(buffer).cast('B') for buffer in self.buffers]
+			self.iovecs = (_IOVec * batch_size)()
+			self.headers = (_MMsgHdr * batch_size)()
+			for i in range(batch_size):
+				self.iovecs[i].iov_base = ctypes.addressof(self.buffers[i])
+				msg_hdr = self.headers[i].msg_hdr
+				msg_hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+				msg_hdr.msg_iovlen = 1
+
+	def send(self, datagrams):
+		"""
+		Send every datagram in order
+
+		Returns (datagrams_sent, bytes_sent, error). error is None when all
+		went out; otherwise it is the exception that stopped the burst, and
+		the counts still cover the datagrams sent before it.
+		"""
+		with self.lock:
+			if not self.batched:
+				return self._send_unbatched(datagrams)
+			return self._send_batched(datagrams)
+
+	def _send_unbatched(self, datagrams):
+		"""One send() per datagram, for platforms without sendmmsg"""
+		datagrams_sent = 0
+		bytes_sent = 0
+		try:
+			for data in datagrams:
+				bytes_sent += self.socket.send(data)
+				datagrams_sent += 1
+		except OSError as e:
+			return datagrams_sent, bytes_sent, e
+		return datagrams_sent, bytes_sent, None
+
+	def _send_batched(self, datagrams):
+		"""sendmmsg() in batch_size chunks through the shared ctypes buffers"""
+		fd = self.socket.fileno()
+		datagrams_sent = 0
+		bytes_sent = 0
+		refused = False
+
+		while datagrams_sent < len(datagrams):
+			batch = datagrams[datagrams_sent:datagrams_sent + self.batch_size]
+			for i, data in enumerate(batch):
+				if len(data) > self.buffer_size:
+					return datagrams_sent, bytes_sent, ValueError(
+						f"Datagram too big for batch buffer: {len(data)}B > {self.buffer_size}B")
+				self.views[i][:len(data)] = data
+				self.iovecs[i].iov_len = len(data)
+
+			count = _libc_sendmmsg(fd, self.headers, len(batch), 0)
+			if count < 0:
+				error = ctypes.get_errno()
+				if error == errno.EINTR:
+					continue
+				if error == errno.ECONNREFUSED and not refused:
+					# An earlier ICMP port unreachable is reported once, on the
+					# next send; the target may simply not be listening yet
+					refused = True
+					continue
+				return datagrams_sent, bytes_sent, OSError(error, os.strerror(error))
+
+			for i in range(count):
+				bytes_sent += self.headers[i].msg_len
+			datagrams_sent += count
+
+		return datagrams_sent, bytes_sent, None
+
+
 # Network transmission class
 class NetworkTransmitter:
 	"""UDP or TCP Encapsulated Network Transmitter for Opulent Voice frames
@@ -2094,6 +2459,7 @@ class NetworkTransmitter:
 		self.socket = None	# socket used for transmitting frames
 		self.rxsocket = None	# socket used for receiving frames in TCP mode
 		self.connection_monitor_thread = None  # Thread to monitor TCP connection
+		self.batch_sender = None  # sendmmsg batches for the connected UDP socket
 		self.running = False
 		self.stats = {
 			'packets_sent': 0,
@@ -2125,6 +2491,15 @@ class NetworkTransmitter:
 			print(f"✓ UDP socket created for {self.target_ip}:{self.target_port}")
 		except Exception as e:
 			print(f"✗ Socket creation error: {e}")
+			return
+
+		# Connecting fixes the destination once, so sends skip the address
+		# lookup and bursts can go out with one sendmmsg call
+		try:
+			self.socket.connect((self.target_ip, self.target_port))
+			self.batch_sender = BatchedDatagramSender(self.socket)
+		except OSError as e:
+			print(f"⚠ UDP connect to {self.target_ip}:{self.target_port} failed, using sendto: {e}")
 
 	def setup_socket_tcp(self):
 			"""Create and maintain a TCP socket to send encapsulated Opulent Voice frames"""
@@ -2186,10 +2561,19 @@ class NetworkTransmitter:
 			return False
 
 		try:
-			bytes_sent = self.socket.sendto(frame_data, (self.target_ip, self.target_port))
+			if self.batch_sender:
+				try:
+					bytes_sent = self.socket.send(frame_data)
+				except ConnectionRefusedError:
+					# A connected UDP socket reports an earlier ICMP port unreachable
+					# on the next send; the target may simply not be listening yet
+					bytes_sent = self.socket.send(frame_data)
+			else:
+				bytes_sent = self.socket.sendto(frame_data, (self.target_ip, self.target_port))
 			self.stats['packets_sent'] += 1
 			self.stats['bytes_sent'] += bytes_sent
-			DebugConfig.debug_print(f"📤 Sent frame: {bytes_sent}B to UDP:{self.target_ip}:{self.target_port}")
+			if DebugConfig.VERBOSE:
+				DebugConfig.debug_print(f"📤 Sent frame: {bytes_sent}B to UDP:{self.target_ip}:{self.target_port}")
 			return True
 
 		except Exception as e:
@@ -2209,7 +2593,8 @@ class NetworkTransmitter:
 			self.socket.sendall(encoded_frame)
 			self.stats['packets_sent'] += 1
 			self.stats['bytes_sent'] += len(encoded_frame)
-			DebugConfig.debug_print(f"📤 Sent frame: {len(encoded_frame)}B to TCP target.")
+			if DebugConfig.VERBOSE:
+				DebugConfig.debug_print(f"📤 Sent frame: {len(encoded_frame)}B to TCP target.")
 			return True
 
 		except Exception as e:
@@ -2217,6 +2602,72 @@ class NetworkTransmitter:
 			DebugConfig.system_print(f"✗ Network send error: {e}")
 			return False
 
+	def send_frames(self, frames):
+		"""Send a burst of Opulent Voice frames, returns how many were sent
+
+		Frames go out back to back, without waiting for the next 40ms slot.
+		"""
+		if self.encap_mode == self.ENCAP_MODE_TCP:
+			return self.send_frames_encap_tcp(frames)
+		elif self.encap_mode == self.ENCAP_MODE_UDP:
+			return self.send_frames_encap_udp(frames)
+		else:
+			print("✗ Invalid encapsulation mode. Use ENCAP_MODE_TCP or ENCAP_MODE_UDP.")
+			return 0
+
+	def send_frames_encap_udp(self, frames):
+		"""Send a burst of Opulent Voice frames encapsulated in UDP"""
+		if not self.socket:
+			return 0
+
+		sendto = self.socket.sendto
+		target = (self.target_ip, self.target_port)
+		frames_sent = 0
+		bytes_sent = 0
+
+		try:
+			if self.batch_sender:
+				frames_sent, bytes_sent, error = self.batch_sender.send(frames)
+				if error is not None:
+					# Frames before the failure did go out and are counted below
+					self.stats['errors'] += 1
+					DebugConfig.system_print(f"✗ Network send error after {frames_sent}/{len(frames)} frames: {error}")
+			else:
+				for frame_data in frames:
+					bytes_sent += sendto(frame_data, target)
+					frames_sent += 1
+
+		except Exception as e:
+			self.stats['errors'] += 1
+			DebugConfig.system_print(f"✗ Network send error: {e}")
+
+		self.stats['packets_sent'] += frames_sent
+		self.stats['bytes_sent'] += bytes_sent
+		if DebugConfig.VERBOSE:
+			DebugConfig.debug_print(f"📤 Sent {frames_sent} frames: {bytes_sent}B to UDP:{self.target_ip}:{self.target_port}")
+		return frames_sent
+
+	def send_frames_encap_tcp(self, frames):
+		"""Send a burst of Opulent Voice frames encapsulated in TCP with one write"""
+		if not self.socket:
+			DebugConfig.system_print("✗ No TCP socket available. Cannot send frames.")
+			return 0
+
+		encoded_frames = b"".join([COBSEncoder.encode(frame_data) for frame_data in frames])
+
+		try:
+			self.socket.sendall(encoded_frames)
+			self.stats['packets_sent'] += len(frames)
+			self.stats['bytes_sent'] += len(encoded_frames)
+			if DebugConfig.VERBOSE:
+				DebugConfig.debug_print(f"📤 Sent {len(frames)} frames: {len(encoded_frames)}B to TCP target.")
+			return len(frames)
+
+		except Exception as e:
+			self.stats['errors'] += 1
+			DebugConfig.system_print(f"✗ Network send error: {e}")
+			return 0
+
 	def get_stats(self):
 		"""Get transmission statistics"""
 		return self.stats.copy()
@@ -2226,6 +2677,7 @@ class NetworkTransmitter:
 		if self.socket:
 			self.socket.close()
 			self.socket = None
+		self.batch_sender = None
 
 
 if __name__ == '__main__':
@@ -0,0 +1,53 @@
+"""
+Tests for the chat-only MessageReceiver.
+
+Run with:  python -m pytest test_message_receiver.py -v
+
+interlocutor.py pulls in the audio stack (numpy, pyaudio, opuslib, ...),
+so these tests are skipped where that is not installed.
+"""
+
+import pytest
+
+interlocutor = pytest.importorskip("interlocutor")
+
+
+class TestMessageReceiverStop:
+    """Shutdown paths may call stop() more than once (Ctrl+C, then finally)."""
+
+    def test_stop_twice_after_start(self):
+        receiver = interlocutor.MessageReceiver(listen_port=0)
+        receiver.start()
+        assert receiver.running
+
+        receiver.stop()
+        receiver.stop()  # must not raise on the already closed sockets
+
+        assert not receiver.running
+        assert receiver.socket is None
+        assert receiver.wakeup_writer is None
+
+    def test_stop_twice_without_start(self):
+        receiver = interlocutor.MessageReceiver(listen_port=0)
+        receiver.stop()
+        receiver.stop()
+        assert not receiver.running
+
+
+class TestTerminalChatInterfaceStop:
+    """The input thread owns the wakeup pipe's read end and must close it."""
+
+    def test_stdin_without_fileno(self, monkeypatch, capsys):
+        import io
+        import os
+
+        monkeypatch.setattr("sys.stdin", io.StringIO())
+        chat = interlocutor.TerminalChatInterface("W1AW", chat_manager=None)
+        chat.start()
+        wakeup_r = chat._wakeup_r
+        chat.input_thread.join(timeout=1.0)
+        chat.stop()
+
+        assert "Chat input error" in capsys.readouterr().out
+        with pytest.raises(OSError):
+            os.fstat(wakeup_r)  # closed by the input thread on exit
@@ -0,0 +1,452 @@
+"""
+Tests for the Opulent Voice protocol helpers in radio_protocol.py.
+
+Run with:  python -m pytest test_radio_protocol.py -v
+"""
+
+import os
+import socket
+import struct
+import threading
+
+import pytest
+
+from radio_protocol import (
+    BatchedDatagramSender,
+    COBSEncoder,
+    IPHeader,
+    OpulentVoiceProtocolWithIP,
+    SimpleFrameReassembler,
+    SimpleFrameSplitter,
+    StationIdentifier,
+    UDPHeader,
+    _ones_complement_sum,
+)
+
+
+# ============================================================
+# COBS encoding
+# ============================================================
+
+# (data, expected encoding with separator), same vectors as the
+# self-test at the bottom of radio_protocol.py
+COBS_VECTORS = [
+    (b"", b"\x01\x00"),
+    (b"ABCD", b"\x05ABCD\x00"),
+    (b"ABCD\x00", b"\x05ABCD\x01\x00"),
+    (b"A" * 253, b"\xfe" + b"A" * 253 + b"\x00"),
+    (b"B" * 254, b"\xff" + b"B" * 254 + b"\x01\x00"),
+    (b"C" * 255, b"\xff" + b"C" * 254 + b"\x02C\x00"),
+    (b"B" * 254 + b"\x00", b"\xff" + b"B" * 254 + b"\x01\x01\x00"),
+    (b"C" * 255 + b"ccccc", b"\xff" + b"C" * 254 + b"\x07Cccccc\x00"),
+    (b"\x00", b"\x01\x01\x00"),
+    (b"\x00" * 5, b"\x01" * 6 + b"\x00"),
+]
+
+
+class TestCOBSEncoder:
+    """Tests for COBS encode/decode, terminated and unterminated."""
+
+    @pytest.mark.parametrize("data, encoded", COBS_VECTORS)
+    def test_encode_known_vectors(self, data, encoded):
+        assert COBSEncoder.encode(data) == encoded
+
+    @pytest.mark.parametrize("data, encoded", COBS_VECTORS)
+    def test_decode_known_vectors(self, data, encoded):
+        assert COBSEncoder.decode(encoded) == data
+
+    @pytest.mark.parametrize("data, encoded", COBS_VECTORS)
+    def test_decode_unterminated(self, data, encoded):
+        assert COBSEncoder.decode_unterminated(encoded[:-1]) == data
+
+    def test_decode_unterminated_prefix_length(self):
+        encoded = COBSEncoder.encode(b"hello\x00world")
+        assert COBSEncoder.decode_unterminated(encoded, len(encoded) - 1) == b"hello\x00world"
+
+    def test_decode_unterminated_accepts_bytearray(self):
+        encoded = COBSEncoder.encode(b"\x00abc\x00")
+        assert COBSEncoder.decode_unterminated(bytearray(encoded[:-1])) == b"\x00abc\x00"
+
+    def test_encoded_data_has_no_inner_zeros(self):
+        data = os.urandom(1000) + bytes(300)
+        encoded = COBSEncoder.encode(data)
+        assert encoded.index(0) == len(encoded) - 1
+
+    @pytest.mark.parametrize("length", [1, 253, 254, 255, 508, 509, 1000])
+    def test_round_trip_random(self, length):
+        for _ in range(20):
+            data = os.urandom(length)
+            assert COBSEncoder.decode(COBSEncoder.encode(data)) == data
+
+    def test_round_trip_all_zero(self):
+        data = bytes(600)
+        assert COBSEncoder.decode(COBSEncoder.encode(data)) == data
+
+    def test_decode_requires_separator(self):
+        with pytest.raises(ValueError):
+            COBSEncoder.decode(b"\x05ABCD")
+
+    def test_decode_rejects_inner_zero(self):
+        with pytest.raises(ValueError):
+            COBSEncoder.decode_unterminated(b"\x05AB\x00D")
+
+    def test_decode_rejects_overlong_block(self):
+        with pytest.raises(ValueError):
+            COBSEncoder.decode_unterminated(b"\x09ABC")
+
+
+# ============================================================
+# Internet checksums
+# ============================================================
+
+def reference_sum(data):
+    """Word-at-a-time RFC 1071 one's complement sum, for comparison"""
+    if len(data) % 2:
+        data += b"\x00"
+    total = 0
+    for i in range(0, len(data), 2):
+        total += (data[i] << 8) | data[i + 1]
+        total = (total & 0xFFFF) + (total >> 16)
+    return total
+
+
+def udp_packet_sum(source_ip, dest_ip, header, payload):
+    """One's complement sum over pseudo-header, UDP header and payload"""
+    pseudo = socket.inet_aton(source_ip) + socket.inet_aton(dest_ip)
+    pseudo += struct.pack("!BBH", 0, 17, len(header) + len(payload))
+    return reference_sum(pseudo + header + payload)
+
+
+class TestOnesComplementSum:
+    """Tests for the shared RFC 1071 summing helper."""
+
+    @pytest.mark.parametrize("length", [0, 1, 2, 3, 7, 20, 81, 120, 1001])
+    def test_matches_reference(self, length):
+        for _ in range(20):
+            data = os.urandom(length)
+            assert _ones_complement_sum(data) == reference_sum(data)
+
+    def test_odd_length_is_zero_padded(self):
+        assert _ones_complement_sum(b"\x12\x34\x56") == 0x1234 + 0x5600
+
+    def test_all_zero_sums_to_zero(self):
+        assert _ones_complement_sum(b"") == 0
+        assert _ones_complement_sum(bytes(7)) == 0
+
+    def test_negative_zero_is_ffff(self):
+        # Nonzero words that add up to a multiple of 0xFFFF fold to 0xFFFF, not 0
+        assert _ones_complement_sum(b"\xff\xff") == 0xFFFF
+        assert _ones_complement_sum(b"\xff\xfe\x00\x01") == 0xFFFF
+        assert _ones_complement_sum(b"\xff\xff" * 50) == 0xFFFF
+
+    def test_accepts_memoryview(self):
+        data = bytearray(os.urandom(41))
+        assert _ones_complement_sum(memoryview(data)) == reference_sum(bytes(data))
+
+
+class TestIPHeaderChecksum:
+    """Tests for the IPv4 header checksum."""
+
+    def test_known_good_header(self):
+        # Worked example: 192.168.0.1 -> 192.168.0.199, checksum 0xB861
+        header = bytes.fromhex("450000730000400040110000c0a80001c0a800c7")
+        ip_header = IPHeader(source_ip="192.168.0.1", dest_ip="192.168.0.199")
+        assert ip_header._calculate_checksum(header) == 0xB861
+
+    def test_created_header_verifies(self):
+        ip_header = IPHeader(source_ip="10.0.0.1", dest_ip="10.1.2.3")
+        for length in (0, 1, 99, 100):
+            header = ip_header.create_header(os.urandom(length))
+            assert reference_sum(header) == 0xFFFF
+
+
+class TestUDPHeaderChecksum:
+    """Tests for the RFC 768 UDP checksum and its cached pseudo-header sum."""
+
+    SOURCE_IP = "10.0.0.1"
+    DEST_IP = "10.1.2.3"
+
+    @pytest.mark.parametrize("length", [0, 1, 2, 3, 79, 80, 91, 1001])
+    def test_checksum_verifies(self, length):
+        udp = UDPHeader(source_port=40000, dest_port=57373)
+        payload = os.urandom(length)
+        header = udp.create_header(payload, source_ip=self.SOURCE_IP, dest_ip=self.DEST_IP)
+        assert udp_packet_sum(self.SOURCE_IP, self.DEST_IP, header, payload) == 0xFFFF
+
+    def test_packed_and_dotted_addresses_agree(self):
+        udp = UDPHeader(source_port=40000, dest_port=57374)
+        payload = os.urandom(33)
+        dotted = udp.create_header(payload, source_ip=self.SOURCE_IP, dest_ip=self.DEST_IP)
+        packed = udp.create_header(payload,
+            source_ip=socket.inet_aton(self.SOURCE_IP), dest_ip=socket.inet_aton(self.DEST_IP))
+        assert dotted == packed
+
+    def test_cached_pseudo_sum_follows_address_changes(self):
+        udp = UDPHeader(source_port=40000, dest_port=57375)
+        payload = os.urandom(50)
+        for dest_ip in ("10.1.2.3", "192.168.1.100", "10.1.2.3"):
+            header = udp.create_header(payload, source_ip=self.SOURCE_IP, dest_ip=dest_ip)
+            assert udp_packet_sum(self.SOURCE_IP, dest_ip, header, payload) == 0xFFFF
+
+    def test_zero_checksum_sent_as_ffff(self):
+        # Choose the last payload word so the packet sums to 0xFFFF before
+        # complementing; the computed checksum is then 0, which UDP sends as 0xFFFF
+        udp = UDPHeader(source_port=40000, dest_port=57373)
+        prefix = b"abcd"
+        partial = udp_packet_sum(self.SOURCE_IP, self.DEST_IP,
+            struct.pack("!HHHH", 40000, 57373, 8 + len(prefix) + 2, 0), prefix + b"\x00\x00")
+        payload = prefix + struct.pack("!H", 0xFFFF - partial)
+        header = udp.create_header(payload, source_ip=self.SOURCE_IP, dest_ip=self.DEST_IP)
+        assert struct.unpack("!H", header[6:8])[0] == 0xFFFF
+        assert udp_packet_sum(self.SOURCE_IP, self.DEST_IP, header, payload) == 0xFFFF
+
+    def test_checksum_disabled_sends_zero(self):
+        udp = UDPHeader(source_port=40000, dest_port=57373)
+        header = udp.create_header(b"abc", calculate_checksum=False)
+        assert header == struct.pack("!HHHH", 40000, 57373, 11, 0)
+
+    @pytest.mark.parametrize("source_ip, dest_ip", [
+        (None, None),
+        ("10.0.0.1", None),
+        (None, "10.1.2.3"),
+    ])
+    def test_missing_address_raises(self, source_ip, dest_ip):
+        udp = UDPHeader(source_port=40000, dest_port=57373)
+        with pytest.raises(ValueError):
+            udp.create_header(b"abc", source_ip=source_ip, dest_ip=dest_ip)
+
+    def test_invalid_address_raises(self):
+        udp = UDPHeader(source_port=40000, dest_port=57373)
+        with pytest.raises(ValueError):
+            udp.create_header(b"abc", source_ip="not-an-ip", dest_ip=self.DEST_IP)
+
+
+# ============================================================
+# Frame reassembly
+# ============================================================
+
+OV_HEADER = b"W1ABC\x00" + b"\xbb\xaa\xdd" + b"\x00\x00\x00"
+PAYLOAD_SIZE = 122
+
+
+def ov_frames_for(stream):
+    """Cut a byte stream into 134-byte OV frames, zero-padding the last one"""
+    frames = []
+    for i in range(0, len(stream), PAYLOAD_SIZE):
+        frames.append(OV_HEADER + stream[i:i + PAYLOAD_SIZE].ljust(PAYLOAD_SIZE, b"\x00"))
+    return frames
+
+
+def reassemble(reassembler, frames):
+    packets = []
+    for frame in frames:
+        packets.extend(reassembler.add_frame_payload(frame, len(OV_HEADER)))
+    return packets
+
+
+class TestSimpleFrameSplitter:
+    """Tests for splitting COBS frames into fixed-size payloads."""
+
+    @pytest.mark.parametrize("size", [0, 1, PAYLOAD_SIZE, PAYLOAD_SIZE + 1, 3 * PAYLOAD_SIZE + 7])
+    def test_split_cobs_frame_returns_padded_bytes(self, size):
+        data = os.urandom(size)
+        payloads = SimpleFrameSplitter().split_cobs_frame(data, "text")
+
+        assert all(type(p) is bytes and len(p) == PAYLOAD_SIZE for p in payloads)
+        joined = b"".join(payloads)
+        assert joined[:size] == data
+        assert joined[size:] == bytes(len(joined) - size)
+        assert len(payloads) == max(1, -(-size // PAYLOAD_SIZE))
+
+
+class TestSimpleFrameReassembler:
+    """Tests for reassembling COBS packets from OV frame payloads."""
+
+    def test_single_frame_packet(self):
+        data = os.urandom(100)
+        reassembler = SimpleFrameReassembler()
+        (packet,) = reassemble(reassembler, ov_frames_for(COBSEncoder.encode(data)))
+        assert COBSEncoder.decode_unterminated(packet) == data
+        assert not reassembler.buffer
+
+    def test_offset_zero_takes_bare_payloads(self):
+        data = os.urandom(300)
+        reassembler = SimpleFrameReassembler()
+        packets = []
+        for frame in ov_frames_for(COBSEncoder.encode(data)):
+            packets.extend(reassembler.add_frame_payload(frame[len(OV_HEADER):]))
+        assert [COBSEncoder.decode_unterminated(p) for p in packets] == [data]
+
+    def test_packet_split_across_payloads(self):
+        data = os.urandom(1000)
+        frames = SimpleFrameSplitter().split_into_ov_frames(COBSEncoder.encode(data), OV_HEADER, "text")
+        assert len(frames) > 1
+
+        reassembler = SimpleFrameReassembler()
+        packets = []
+        for frame in frames[:-1]:
+            assert reassembler.add_frame_payload(frame, len(OV_HEADER)) == []
+        packets.extend(reassembler.add_frame_payload(frames[-1], len(OV_HEADER)))
+
+        assert [COBSEncoder.decode_unterminated(p) for p in packets] == [data]
+        assert reassembler.stats['messages_completed'] == 1
+
+    def test_packets_sharing_payloads(self):
+        messages = [os.urandom(n) for n in (10, 200, 0, 121, 5, 400)]
+        stream = b"".join(COBSEncoder.encode(m) for m in messages)
+        packets = reassemble(SimpleFrameReassembler(), ov_frames_for(stream))
+        assert [COBSEncoder.decode_unterminated(p) for p in packets] == messages
+
+    def test_overflow_discards_and_resyncs(self):
+        reassembler = SimpleFrameReassembler()
+        junk_frame = OV_HEADER + b"\x01" * PAYLOAD_SIZE
+        junk_frames = SimpleFrameReassembler.MAX_COBS_FRAME_SIZE // PAYLOAD_SIZE + 2
+
+        for _ in range(junk_frames):
+            assert reassembler.add_frame_payload(junk_frame, len(OV_HEADER)) == []
+        assert reassembler.stats['buffer_overflows'] == 1
+        assert len(reassembler.buffer) <= SimpleFrameReassembler.MAX_COBS_FRAME_SIZE
+
+        # The rest of the oversized packet, up to its delimiter, is dropped;
+        # the packet after it comes through intact
+        data = os.urandom(50)
+        stream = b"\x01" * 30 + b"\x00" + COBSEncoder.encode(data)
+        packets = reassemble(reassembler, ov_frames_for(stream))
+        assert [COBSEncoder.decode_unterminated(p) for p in packets] == [data]
+        assert reassembler.stats['buffer_overflows'] == 1
+
+    def test_buffer_never_exceeds_limit(self):
+        reassembler = SimpleFrameReassembler()
+        junk_frame = OV_HEADER + b"\x07" * PAYLOAD_SIZE
+        for _ in range(2 * SimpleFrameReassembler.MAX_COBS_FRAME_SIZE // PAYLOAD_SIZE):
+            reassembler.add_frame_payload(junk_frame, len(OV_HEADER))
+            assert len(reassembler.buffer) <= SimpleFrameReassembler.MAX_COBS_FRAME_SIZE
+
+    def test_modifying_returned_packet_does_not_corrupt_later_ones(self):
+        messages = [os.urandom(n) for n in (300, 250, 90, 500)]
+        stream = b"".join(COBSEncoder.encode(m) for m in messages)
+
+        reassembler = SimpleFrameReassembler()
+        decoded = []
+        mutable_packets = 0
+        for frame in ov_frames_for(stream):
+            for packet in reassembler.add_frame_payload(frame, len(OV_HEADER)):
+                decoded.append(COBSEncoder.decode_unterminated(packet))
+                # Scribble over anything the caller was handed that is mutable
+                if isinstance(packet, bytearray):
+                    mutable_packets += 1
+                    assert packet is not reassembler.buffer
+                    packet[:] = b"\xff" * len(packet)
+                    packet.extend(b"\xee" * 64)
+
+        assert mutable_packets > 0  # multi-payload packets are handed over as bytearrays
+        assert decoded == messages
+
+
+# ============================================================
+# Batched UDP sending
+# ============================================================
+
+@pytest.fixture
+def udp_pair():
+    """A receiving UDP socket and a sending socket connected to it"""
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(2.0)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.connect(receiver.getsockname())
+    yield receiver, sender
+    sender.close()
+    receiver.close()
+
+
+class TestBatchedDatagramSender:
+    """Tests for sendmmsg bursts through the shared send buffers."""
+
+    def test_sends_burst_in_order(self, udp_pair):
+        receiver, sender = udp_pair
+        datagrams = [os.urandom(134) for _ in range(40)]
+        sent, bytes_sent, error = BatchedDatagramSender(sender, batch_size=16).send(datagrams)
+        assert (sent, bytes_sent, error) == (40, 40 * 134, None)
+        assert [receiver.recv(4096) for _ in datagrams] == datagrams
+
+    def test_partial_send_is_reported(self, udp_pair):
+        receiver, sender = udp_pair
+        batch_sender = BatchedDatagramSender(sender, batch_size=1, buffer_size=200)
+        datagrams = [os.urandom(134), os.urandom(134), os.urandom(500), os.urandom(134)]
+
+        sent, bytes_sent, error = batch_sender.send(datagrams)
+
+        assert error is not None
+        assert (sent, bytes_sent) == (2, 2 * 134)
+        assert [receiver.recv(4096) for _ in range(2)] == datagrams[:2]
+
+    def test_concurrent_bursts_are_not_mixed(self, udp_pair):
+        receiver, sender = udp_pair
+        batch_sender = BatchedDatagramSender(sender, batch_size=8)
+        bursts = [[bytes([n]) * 134 + os.urandom(8) for _ in range(50)] for n in (1, 2, 3, 4)]
+        results = []
+
+        def send_burst(burst):
+            for i in range(0, len(burst), 5):
+                results.append(batch_sender.send(burst[i:i + 5]))
+
+        threads = [threading.Thread(target=send_burst, args=(burst,)) for burst in bursts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = {datagram for burst in bursts for datagram in burst}
+        received = {receiver.recv(4096) for _ in range(len(expected))}
+        assert all(error is None for _, _, error in results)
+        assert received == expected
+
+
+# ============================================================
+# Frame builders
+# ============================================================
+
+@pytest.fixture
+def protocol(capsys):
+    proto = OpulentVoiceProtocolWithIP(StationIdentifier("W1ABC"), dest_ip="10.1.2.3")
+    capsys.readouterr()  # drop the setup banner
+    return proto
+
+
+class TestFrameBuilders:
+    """Frames handed out by the protocol must not change under the caller."""
+
+    def test_audio_frames_are_independent(self, protocol):
+        (first,) = protocol.create_audio_frames(os.urandom(80))
+        kept = bytes(first)
+        (second,) = protocol.create_audio_frames(os.urandom(80))
+
+        assert isinstance(first, bytes)
+        assert len(first) == len(second) == 134
+        assert first == kept
+        assert first != second
+
+    def test_coalesced_frames_are_independent(self, protocol):
+        packets = [protocol.create_control_packet(b"PTT_STOP"), protocol.create_text_packet(b"hi")]
+        first = protocol.create_coalesced_frames(packets)
+        kept = bytes(first[0])
+        protocol.create_coalesced_frames([protocol.create_text_packet(b"something else")])
+
+        assert isinstance(first, list) and len(first) == 1
+        assert isinstance(first[0], bytes)
+        assert len(first[0]) == 134
+        assert first[0] == kept
+
+    def test_coalesced_frame_reassembles(self, protocol):
+        messages = [b"PTT_STOP", b"hello"]
+        packets = [protocol.create_control_packet(messages[0]), protocol.create_text_packet(messages[1])]
+        (frame,) = protocol.create_coalesced_frames(packets)
+        cobs_packets = SimpleFrameReassembler().add_frame_payload(frame, 12)
+        ip_frames = [COBSEncoder.decode_unterminated(p) for p in cobs_packets]
+        assert [ip[28:] for ip in ip_frames] == messages
+
+    def test_coalesced_frames_reject_overflow(self, protocol):
+        with pytest.raises(ValueError):
+            protocol.create_coalesced_frames([protocol.create_text_packet(b"x" * 200)])